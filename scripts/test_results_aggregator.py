@@ -16,8 +16,10 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 import glob
+import heapq
 import statistics
 from dataclasses import dataclass
+from operator import itemgetter
 import requests
 
 
@@ -522,7 +524,7 @@ class TestResultsAggregator:
                     })
         
         # Sort by flakiness score
-        flaky_tests.sort(key=lambda x: x["flakiness_score"], reverse=True)
+        flaky_tests.sort(key=itemgetter("flakiness_score"), reverse=True)
         
         return flaky_tests
     
@@ -653,10 +655,18 @@ class TestResultsAggregator:
         
         return trends
     
+    def _write_report(self, report_path: Path, parts: List[str]) -> None:
+        """Write a report in one call, swapping it into place atomically."""
+        tmp_path = report_path.with_suffix(report_path.suffix + ".tmp")
+        tmp_path.write_text("".join(parts), encoding="utf-8")
+        os.replace(tmp_path, report_path)
+
     def _generate_aggregated_report(self, aggregated_data: Dict[str, Any]) -> Path:
         """Generate comprehensive aggregated test report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_path = self.reports_dir / f"aggregated_test_report_{timestamp}.md"
+        now = datetime.now()
+        ts_compact = now.strftime("%Y%m%d_%H%M%S")
+        ts_human = now.strftime("%Y-%m-%d %H:%M:%S")
+        report_path = self.reports_dir / f"aggregated_test_report_{ts_compact}.md"
         
         summary = aggregated_data["summary"]
         quality = aggregated_data["quality_metrics"]
@@ -664,183 +674,191 @@ class TestResultsAggregator:
         flaky_tests = aggregated_data["flaky_tests"]
         trends = aggregated_data["trends"]
         
-        with open(report_path, "w") as f:
-            f.write(f"""# Comprehensive Test Results Report
+        parts: List[str] = []
+        parts.append(f"""# Comprehensive Test Results Report
 
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {ts_human}
 **Sources Processed**: {len(aggregated_data['sources'])}
 **Test Suites**: {summary.get('test_suites_count', 0)}
 
 ## Executive Summary
 
 """)
+        
+        # Status emoji based on success rate
+        success_rate = summary.get('success_rate', 0)
+        status_emoji = "🟢" if success_rate >= 95 else "🟡" if success_rate >= 85 else "🔴"
+        
+        parts.append(f"**Overall Status**: {status_emoji} {success_rate:.1f}% Success Rate\n\n")
+        
+        # Key metrics
+        parts.append("### Key Metrics\n\n")
+        parts.append(f"- **Total Tests**: {summary.get('total_tests', 0):,}\n")
+        parts.append(f"- **Passed**: {summary.get('passed', 0):,} ✅\n")
+        parts.append(f"- **Failed**: {summary.get('failed', 0):,} ❌\n")
+        parts.append(f"- **Errors**: {summary.get('errors', 0):,} 💥\n")
+        parts.append(f"- **Skipped**: {summary.get('skipped', 0):,} ⏭️\n")
+        parts.append(f"- **Execution Time**: {summary.get('total_execution_time', 0):.1f}s\n")
+        
+        if quality.get('overall_quality_score') is not None:
+            score = quality['overall_quality_score']
+            score_emoji = "🟢" if score >= 90 else "🟡" if score >= 75 else "🔴"
+            parts.append(f"- **Quality Score**: {score_emoji} {score}/100\n")
+        
+        # Coverage information
+        if coverage:
+            cov_emoji = "🟢" if coverage.line_coverage >= 85 else "🟡" if coverage.line_coverage >= 75 else "🔴"
+            parts.append(f"- **Line Coverage**: {cov_emoji} {coverage.line_coverage:.1f}%\n")
+            parts.append(f"- **Branch Coverage**: {coverage.branch_coverage:.1f}%\n")
+        
+        parts.append("\n")
+        
+        # Platform distribution
+        if summary.get('platforms'):
+            parts.append("### Platform Distribution\n\n")
+            for platform, count in summary['platforms'].items():
+                parts.append(f"- **{platform}**: {count} test suite(s)\n")
+            parts.append("\n")
+        
+        # Python version distribution
+        if summary.get('python_versions'):
+            parts.append("### Python Version Distribution\n\n")
+            for version, count in summary['python_versions'].items():
+                parts.append(f"- **Python {version}**: {count} test suite(s)\n")
+            parts.append("\n")
+        
+        # Test performance analysis
+        if quality.get('test_time_stats'):
+            stats = quality['test_time_stats']
+            parts.append("### Test Performance Analysis\n\n")
+            parts.append(f"- **Average Test Time**: {stats['mean']:.3f}s\n")
+            parts.append(f"- **Median Test Time**: {stats['median']:.3f}s\n")
+            parts.append(f"- **Slowest Test**: {stats['max']:.3f}s\n")
+            parts.append(f"- **95th Percentile**: {stats['p95']:.3f}s\n\n")
+        
+        # Flaky tests (top 10)
+        top_flaky = flaky_tests[:10]
+        if top_flaky:
+            parts.append("## 🚨 Flaky Tests Detected\n\n")
+            parts.append("Tests showing inconsistent behavior across multiple runs:\n\n")
+            parts.append("| Test Name | Runs | Failed | Flakiness | Severity |\n")
+            parts.append("|-----------|------|---------|-----------|----------|\n")
             
-            # Status emoji based on success rate
-            success_rate = summary.get('success_rate', 0)
-            status_emoji = "🟢" if success_rate >= 95 else "🟡" if success_rate >= 85 else "🔴"
+            for test in top_flaky:
+                severity_emoji = "🔴" if test['severity'] == 'high' else "🟡"
+                parts.append(f"| {test['test_name']} | {test['total_runs']} | {test['failed_runs']} | {test['flakiness_score']:.1%} | {severity_emoji} {test['severity']} |\n")
             
-            f.write(f"**Overall Status**: {status_emoji} {success_rate:.1f}% Success Rate\n\n")
+            parts.append("\n")
+        
+        # Failure analysis
+        failure_distribution = quality.get('failure_distribution')
+        if failure_distribution:
+            parts.append("## Failure Analysis\n\n")
+            parts.append("### Failures by Test Class\n\n")
+            parts.append("| Test Class | Failure Count |\n")
+            parts.append("|------------|---------------|\n")
             
-            # Key metrics
-            f.write("### Key Metrics\n\n")
-            f.write(f"- **Total Tests**: {summary.get('total_tests', 0):,}\n")
-            f.write(f"- **Passed**: {summary.get('passed', 0):,} ✅\n")
-            f.write(f"- **Failed**: {summary.get('failed', 0):,} ❌\n")
-            f.write(f"- **Errors**: {summary.get('errors', 0):,} 💥\n")
-            f.write(f"- **Skipped**: {summary.get('skipped', 0):,} ⏭️\n")
-            f.write(f"- **Execution Time**: {summary.get('total_execution_time', 0):.1f}s\n")
+            top_failures = heapq.nlargest(
+                10, failure_distribution.items(), key=itemgetter(1)
+            )
             
-            if quality.get('overall_quality_score') is not None:
-                score = quality['overall_quality_score']
-                score_emoji = "🟢" if score >= 90 else "🟡" if score >= 75 else "🔴"
-                f.write(f"- **Quality Score**: {score_emoji} {score}/100\n")
+            for class_name, count in top_failures:
+                parts.append(f"| {class_name} | {count} |\n")
             
-            # Coverage information
-            if coverage:
-                cov_emoji = "🟢" if coverage.line_coverage >= 85 else "🟡" if coverage.line_coverage >= 75 else "🔴"
-                f.write(f"- **Line Coverage**: {cov_emoji} {coverage.line_coverage:.1f}%\n")
-                f.write(f"- **Branch Coverage**: {coverage.branch_coverage:.1f}%\n")
-            
-            f.write("\n")
-            
-            # Platform distribution
-            if summary.get('platforms'):
-                f.write("### Platform Distribution\n\n")
-                for platform, count in summary['platforms'].items():
-                    f.write(f"- **{platform}**: {count} test suite(s)\n")
-                f.write("\n")
-            
-            # Python version distribution
-            if summary.get('python_versions'):
-                f.write("### Python Version Distribution\n\n")
-                for version, count in summary['python_versions'].items():
-                    f.write(f"- **Python {version}**: {count} test suite(s)\n")
-                f.write("\n")
-            
-            # Test performance analysis
-            if quality.get('test_time_stats'):
-                stats = quality['test_time_stats']
-                f.write("### Test Performance Analysis\n\n")
-                f.write(f"- **Average Test Time**: {stats['mean']:.3f}s\n")
-                f.write(f"- **Median Test Time**: {stats['median']:.3f}s\n")
-                f.write(f"- **Slowest Test**: {stats['max']:.3f}s\n")
-                f.write(f"- **95th Percentile**: {stats['p95']:.3f}s\n\n")
-            
-            # Flaky tests
-            if flaky_tests:
-                f.write("## 🚨 Flaky Tests Detected\n\n")
-                f.write("Tests showing inconsistent behavior across multiple runs:\n\n")
-                f.write("| Test Name | Runs | Failed | Flakiness | Severity |\n")
-                f.write("|-----------|------|---------|-----------|----------|\n")
-                
-                for test in flaky_tests[:10]:  # Top 10 flaky tests
-                    severity_emoji = "🔴" if test['severity'] == 'high' else "🟡"
-                    f.write(f"| {test['test_name']} | {test['total_runs']} | {test['failed_runs']} | {test['flakiness_score']:.1%} | {severity_emoji} {test['severity']} |\n")
-                
-                f.write("\n")
-            
-            # Failure analysis
-            if quality.get('failure_distribution'):
-                f.write("## Failure Analysis\n\n")
-                f.write("### Failures by Test Class\n\n")
-                f.write("| Test Class | Failure Count |\n")
-                f.write("|------------|---------------|\n")
-                
-                sorted_failures = sorted(
-                    quality['failure_distribution'].items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-                
-                for class_name, count in sorted_failures[:10]:
-                    f.write(f"| {class_name} | {count} |\n")
-                
-                f.write("\n")
+            parts.append("\n")
+        
+        # Coverage analysis
+        if coverage:
+            parts.append("## Coverage Analysis\n\n")
             
-            # Coverage analysis
-            if coverage:
-                f.write("## Coverage Analysis\n\n")
+            if quality.get('coverage_quality'):
+                cov_quality = quality['coverage_quality']
+                grade_emoji = {
+                    'A': '🟢', 'B': '🟡', 'C': '🟠', 'D': '🔴', 'F': '💀'
+                }.get(cov_quality['grade'], '❓')
                 
-                if quality.get('coverage_quality'):
-                    cov_quality = quality['coverage_quality']
-                    grade_emoji = {
-                        'A': '🟢', 'B': '🟡', 'C': '🟠', 'D': '🔴', 'F': '💀'
-                    }.get(cov_quality['grade'], '❓')
-                    
-                    f.write(f"**Coverage Grade**: {grade_emoji} {cov_quality['grade']}\n\n")
-                
-                f.write(f"- **Line Coverage**: {coverage.line_coverage:.1f}%\n")
-                f.write(f"- **Branch Coverage**: {coverage.branch_coverage:.1f}%\n")
-                f.write(f"- **Function Coverage**: {coverage.function_coverage:.1f}%\n")
-                f.write(f"- **Files Analyzed**: {coverage.files_analyzed}\n")
-                f.write(f"- **Total Statements**: {coverage.statements:,}\n")
-                f.write(f"- **Missing Coverage**: {coverage.missing:,}\n\n")
-            
-            # Trends analysis
-            if trends:
-                f.write("## Trends Analysis (Last 14 Days)\n\n")
+                parts.append(f"**Coverage Grade**: {grade_emoji} {cov_quality['grade']}\n\n")
+            
+            parts.append(f"- **Line Coverage**: {coverage.line_coverage:.1f}%\n")
+            parts.append(f"- **Branch Coverage**: {coverage.branch_coverage:.1f}%\n")
+            parts.append(f"- **Function Coverage**: {coverage.function_coverage:.1f}%\n")
+            parts.append(f"- **Files Analyzed**: {coverage.files_analyzed}\n")
+            parts.append(f"- **Total Statements**: {coverage.statements:,}\n")
+            parts.append(f"- **Missing Coverage**: {coverage.missing:,}\n\n")
+        
+        # Trends analysis - only metrics with at least two data points
+        eligible_trends = [
+            (metric_name, trend_data)
+            for metric_name, trend_data in trends.items()
+            if len(trend_data) >= 2
+        ]
+        if eligible_trends:
+            parts.append("## Trends Analysis (Last 14 Days)\n\n")
+            
+            for metric_name, trend_data in eligible_trends:
+                latest = trend_data[-1]['value']
+                previous = trend_data[-2]['value']
+                change = latest - previous
                 
-                for metric_name, trend_data in trends.items():
-                    if len(trend_data) >= 2:
-                        latest = trend_data[-1]['value']
-                        previous = trend_data[-2]['value']
-                        change = latest - previous
-                        
-                        if change > 0:
-                            trend_emoji = "📈" if metric_name in ['success_rate', 'line_coverage', 'quality_score'] else "📉"
-                        elif change < 0:
-                            trend_emoji = "📉" if metric_name in ['success_rate', 'line_coverage', 'quality_score'] else "📈"
-                        else:
-                            trend_emoji = "➡️"
-                        
-                        f.write(f"- **{metric_name.replace('_', ' ').title()}**: {trend_emoji} {latest:.1f} (Δ{change:+.1f})\n")
+                if change > 0:
+                    trend_emoji = "📈" if metric_name in ['success_rate', 'line_coverage', 'quality_score'] else "📉"
+                elif change < 0:
+                    trend_emoji = "📉" if metric_name in ['success_rate', 'line_coverage', 'quality_score'] else "📈"
+                else:
+                    trend_emoji = "➡️"
                 
-                f.write("\n")
-            
-            # Recommendations
-            f.write("## Recommendations\n\n")
-            
-            # Performance recommendations
-            if success_rate < 95:
-                f.write("### Test Reliability\n")
-                f.write(f"- 🔴 **Critical**: Success rate ({success_rate:.1f}%) below target (95%)\n")
-                f.write("- 🔧 **Action**: Investigate and fix failing tests\n")
-                if flaky_tests:
-                    f.write("- 🔧 **Action**: Address flaky tests to improve reliability\n")
-                f.write("\n")
-            
-            if coverage and coverage.line_coverage < 85:
-                f.write("### Coverage Improvement\n")
-                f.write(f"- 🟡 **Warning**: Line coverage ({coverage.line_coverage:.1f}%) below target (85%)\n")
-                f.write("- 🔧 **Action**: Add tests for uncovered code paths\n")
-                f.write("- 🔧 **Action**: Review coverage gaps in critical modules\n\n")
-            
-            if quality.get('test_time_stats', {}).get('p95', 0) > 5.0:
-                f.write("### Performance Optimization\n")
-                f.write("- ⚠️ **Notice**: Some tests are running slowly (>5s)\n")
-                f.write("- 🔧 **Action**: Profile and optimize slow tests\n")
-                f.write("- 🔧 **Action**: Consider parallel test execution\n\n")
-            
-            # General recommendations
-            f.write("### General Quality Improvements\n")
-            f.write("- 📊 **Monitor**: Track test trends over time\n")
-            f.write("- 🧪 **Expand**: Add more integration and end-to-end tests\n")
-            f.write("- 🔄 **Automate**: Ensure CI/CD pipeline includes all quality gates\n")
-            f.write("- 📈 **Measure**: Set up alerting for quality regressions\n\n")
-            
-            # Data sources
-            f.write("## Data Sources\n\n")
-            for i, source in enumerate(aggregated_data['sources'], 1):
-                f.write(f"{i}. `{source}`\n")
-            
-            f.write(f"\n---\n*Report generated by AI Trackdown PyTools Test Results Aggregator*\n")
+                parts.append(f"- **{metric_name.replace('_', ' ').title()}**: {trend_emoji} {latest:.1f} (Δ{change:+.1f})\n")
+            
+            parts.append("\n")
+        
+        # Recommendations
+        parts.append("## Recommendations\n\n")
+        
+        # Performance recommendations
+        if success_rate < 95:
+            parts.append("### Test Reliability\n")
+            parts.append(f"- 🔴 **Critical**: Success rate ({success_rate:.1f}%) below target (95%)\n")
+            parts.append("- 🔧 **Action**: Investigate and fix failing tests\n")
+            if flaky_tests:
+                parts.append("- 🔧 **Action**: Address flaky tests to improve reliability\n")
+            parts.append("\n")
+        
+        if coverage and coverage.line_coverage < 85:
+            parts.append("### Coverage Improvement\n")
+            parts.append(f"- 🟡 **Warning**: Line coverage ({coverage.line_coverage:.1f}%) below target (85%)\n")
+            parts.append("- 🔧 **Action**: Add tests for uncovered code paths\n")
+            parts.append("- 🔧 **Action**: Review coverage gaps in critical modules\n\n")
+        
+        if quality.get('test_time_stats', {}).get('p95', 0) > 5.0:
+            parts.append("### Performance Optimization\n")
+            parts.append("- ⚠️ **Notice**: Some tests are running slowly (>5s)\n")
+            parts.append("- 🔧 **Action**: Profile and optimize slow tests\n")
+            parts.append("- 🔧 **Action**: Consider parallel test execution\n\n")
+        
+        # General recommendations
+        parts.append("### General Quality Improvements\n")
+        parts.append("- 📊 **Monitor**: Track test trends over time\n")
+        parts.append("- 🧪 **Expand**: Add more integration and end-to-end tests\n")
+        parts.append("- 🔄 **Automate**: Ensure CI/CD pipeline includes all quality gates\n")
+        parts.append("- 📈 **Measure**: Set up alerting for quality regressions\n\n")
+        
+        # Data sources
+        parts.append("## Data Sources\n\n")
+        for i, source in enumerate(aggregated_data['sources'], 1):
+            parts.append(f"{i}. `{source}`\n")
+        
+        parts.append(f"\n---\n*Report generated by AI Trackdown PyTools Test Results Aggregator*\n")
+
+        self._write_report(report_path, parts)
         
         return report_path
     
     def generate_historical_analysis(self, days: int = 30) -> Path:
         """Generate historical test analysis report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_path = self.reports_dir / f"historical_analysis_{timestamp}.md"
+        now = datetime.now()
+        ts_compact = now.strftime("%Y%m%d_%H%M%S")
+        ts_human = now.strftime("%Y-%m-%d %H:%M:%S")
+        report_path = self.reports_dir / f"historical_analysis_{ts_compact}.md"
         
         with sqlite3.connect(self.results_db) as conn:
             # Get historical test data
@@ -874,53 +892,55 @@ class TestResultsAggregator:
             coverage_trends = cursor.fetchall()
         
         # Generate report
-        with open(report_path, "w") as f:
-            f.write(f"""# Historical Test Analysis Report
+        parts: List[str] = []
+        parts.append(f"""# Historical Test Analysis Report
 
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {ts_human}
 **Analysis Period**: Last {days} days
 **Data Points**: {len(historical_data)} days
 
 ## Trend Summary
 
 """)
+        
+        if historical_data:
+            # Calculate overall trends
+            first_day = historical_data[0]
+            last_day = historical_data[-1]
             
-            if historical_data:
-                # Calculate overall trends
-                first_day = historical_data[0]
-                last_day = historical_data[-1]
-                
-                success_trend = last_day[1] - first_day[1]
-                tests_trend = last_day[2] - first_day[2]
-                time_trend = last_day[3] - first_day[3]
-                
-                f.write(f"- **Success Rate Trend**: {success_trend:+.1f}% over {days} days\n")
-                f.write(f"- **Test Count Trend**: {tests_trend:+.0f} tests\n")
-                f.write(f"- **Execution Time Trend**: {time_trend:+.1f}s\n\n")
-                
-                # Daily breakdown
-                f.write("## Daily Test Results\n\n")
-                f.write("| Date | Success Rate | Total Tests | Execution Time | Runs |\n")
-                f.write("|------|--------------|-------------|----------------|------|\n")
-                
-                for date, success, tests, time, runs in historical_data:
-                    f.write(f"| {date} | {success:.1f}% | {int(tests)} | {time:.1f}s | {runs} |\n")
-                
-                f.write("\n")
+            success_trend = last_day[1] - first_day[1]
+            tests_trend = last_day[2] - first_day[2]
+            time_trend = last_day[3] - first_day[3]
             
-            if coverage_trends:
-                f.write("## Coverage Trends\n\n")
-                f.write("Coverage data over time:\n\n")
-                f.write("| Date | Line Coverage | Branch Coverage |\n")
-                f.write("|------|---------------|------------------|\n")
-                
-                for timestamp, line_cov, branch_cov in coverage_trends[-10:]:  # Last 10
-                    date = timestamp.split('T')[0]
-                    line_str = f"{line_cov:.1f}%" if line_cov else "N/A"
-                    branch_str = f"{branch_cov:.1f}%" if branch_cov else "N/A"
-                    f.write(f"| {date} | {line_str} | {branch_str} |\n")
+            parts.append(f"- **Success Rate Trend**: {success_trend:+.1f}% over {days} days\n")
+            parts.append(f"- **Test Count Trend**: {tests_trend:+.0f} tests\n")
+            parts.append(f"- **Execution Time Trend**: {time_trend:+.1f}s\n\n")
+            
+            # Daily breakdown
+            parts.append("## Daily Test Results\n\n")
+            parts.append("| Date | Success Rate | Total Tests | Execution Time | Runs |\n")
+            parts.append("|------|--------------|-------------|----------------|------|\n")
             
-            f.write(f"\n---\n*Historical analysis generated by AI Trackdown PyTools*\n")
+            for date, success, tests, time, runs in historical_data:
+                parts.append(f"| {date} | {success:.1f}% | {int(tests)} | {time:.1f}s | {runs} |\n")
+            
+            parts.append("\n")
+        
+        if coverage_trends:
+            parts.append("## Coverage Trends\n\n")
+            parts.append("Coverage data over time:\n\n")
+            parts.append("| Date | Line Coverage | Branch Coverage |\n")
+            parts.append("|------|---------------|------------------|\n")
+            
+            for timestamp, line_cov, branch_cov in coverage_trends[-10:]:  # Last 10
+                date = timestamp.split('T')[0]
+                line_str = f"{line_cov:.1f}%" if line_cov else "N/A"
+                branch_str = f"{branch_cov:.1f}%" if branch_cov else "N/A"
+                parts.append(f"| {date} | {line_str} | {branch_str} |\n")
+        
+        parts.append(f"\n---\n*Historical analysis generated by AI Trackdown PyTools*\n")
+
+        self._write_report(report_path, parts)
         
         return report_path
 
@@ -960,11 +980,12 @@ def main():
     args = parser.parse_args()
     
     # Determine project root
-    project_root = Path.cwd()
-    if not (project_root / "pyproject.toml").exists():
+    cwd = os.getcwd()
+    if not os.path.exists(os.path.join(cwd, "pyproject.toml")):
         print("❌ Not in a Python project directory")
         sys.exit(1)
-    
+    project_root = Path(cwd)
+
     aggregator = TestResultsAggregator(project_root)
     
     try:
@@ -6,28 +6,67 @@ This script provides comprehensive test execution with integrated coverage analy
 reporting, and CI/CD integration capabilities.
 """
 import argparse
-import json
+import importlib.util
 import os
 import sys
 import subprocess
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Modules only needed for result parsing (json, xml.etree) are imported inside
+# the methods that use them, keeping `--help` and collection-only runs lean.
+
+
+COVERAGE_MODES = ("off", "line", "branch")
+
+# Coverage report formats, in the order they are requested from pytest-cov.
+# HTML is by far the slowest to render; JSON is always produced because the
+# summary totals are read from it.
+REPORT_FORMATS = ("term", "html", "xml", "json", "lcov")
+
+# Failed test details kept from JUnit XML; the report shows far fewer
+MAX_FAILED_TESTS = 100
+
+# Human-readable artifact locations for each file-based report format
+REPORT_ARTIFACTS = {
+    "html": ("HTML Report", "htmlcov/index.html"),
+    "xml": ("XML Report", "coverage.xml"),
+    "json": ("JSON Report", "coverage.json"),
+    "lcov": ("LCOV Report", "coverage.lcov"),
+}
+
+# Shell-only variables that pytest never reads; dropping them keeps the
+# environment block copied into every child process small.
+UNUSED_ENV_VARS = frozenset({
+    "LS_COLORS", "LSCOLORS", "PS1", "PROMPT_COMMAND",
+    "VIRTUAL_ENV_DISABLE_PROMPT", "HISTFILE", "HISTSIZE", "HISTCONTROL",
+})
 
 
 class TestRunner:
     """Enhanced test runner with coverage integration."""
     
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, workers: str = "auto"):
         self.project_root = project_root
+        self.workers = workers
+        # coverage JSON analysis keyed by (path, mtime_ns, size)
+        self._cov_cache: Dict[Tuple[str, int, int], Dict] = {}
         self.test_reports_dir = project_root / "test-reports"
-        self.test_reports_dir.mkdir(exist_ok=True)
         
         # Coverage directories
         self.coverage_dir = project_root / "coverage-reports"
-        self.coverage_dir.mkdir(exist_ok=True)
+        
+        # Output directories are created on first write (see _ensure_dirs)
+        self._dirs_ready = False
+    
+    def _ensure_dirs(self) -> None:
+        """Create the report directories once, before the first write."""
+        if not self._dirs_ready:
+            self.test_reports_dir.mkdir(exist_ok=True)
+            self.coverage_dir.mkdir(exist_ok=True)
+            self._dirs_ready = True
     
     def run_tests_with_coverage(self,
                               test_paths: Optional[List[str]] = None,
@@ -35,15 +74,78 @@ class TestRunner:
                               fail_fast: bool = False,
                               verbose: bool = False,
                               markers: Optional[List[str]] = None,
-                              generate_reports: bool = True) -> Dict:
-        """Run tests with comprehensive coverage analysis."""
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                              generate_reports: bool = True,
+                              workers: Optional[str] = None,
+                              coverage_mode: str = "branch",
+                              collect_only: bool = False,
+                              profile_collection: bool = False,
+                              report_formats: Optional[Iterable[str]] = None,
+                              rerun_failed: bool = False,
+                              failed_first: bool = False,
+                              strict: bool = True,
+                              label: Optional[str] = None,
+                              junit_compat: bool = False) -> Dict:
+        """Run tests with comprehensive coverage analysis.
+        
+        ``coverage_mode`` is one of ``"off"``, ``"line"`` or ``"branch"``;
+        ``"off"`` skips instrumentation entirely for quick red/green loops.
+        ``collect_only`` and ``profile_collection`` only collect tests (the
+        latter under pyinstrument) with coverage, reports and xdist disabled.
+        ``report_formats`` limits the coverage reports written (any of
+        ``REPORT_FORMATS``; all of them by default).
+        ``rerun_failed`` runs only the tests that failed last time (using
+        ``.pytest_cache``) without coverage; ``failed_first`` runs them first.
+        ``strict=False`` skips marker/config validation and the ``-ra`` and
+        ``--durations`` summaries for faster start-up in dev loops.
+        ``label`` gives the run its own artifact and coverage data names so
+        several runs can execute side by side (see ``run_suites_parallel``).
+        Results are read from pytest-json-report output when the plugin is
+        installed; ``junit_compat`` additionally writes JUnit XML for CI
+        systems that require it.
+        """
+        if coverage_mode not in COVERAGE_MODES:
+            raise ValueError(f"Unknown coverage mode: {coverage_mode}")
         
-        print("🧪 Starting comprehensive test execution with coverage...")
-        print(f"📊 Coverage threshold: {coverage_threshold}%")
+        formats = set(REPORT_FORMATS if report_formats is None else report_formats)
+        unknown = formats.difference(REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown report format(s): {', '.join(sorted(unknown))}")
+        if not generate_reports or label:
+            # Labelled runs share htmlcov/coverage.xml/...; those reports are
+            # rebuilt from the combined data once all runs have finished
+            formats &= {"term"}
+        formats.add("json")
+        coverage_json = self.project_root / (
+            f"coverage-{label}.json" if label else "coverage.json"
+        )
+        
+        if rerun_failed:
+            # Coverage of a handful of re-run tests is meaningless
+            coverage_mode = "off"
+        
+        collecting = collect_only or profile_collection
+        if collecting:
+            # xdist workers re-collect everything and slow collection down
+            coverage_mode = "off"
+            workers = "1"
+        
+        workers = str(workers if workers is not None else self.workers)
+        parallel = workers not in ("0", "1")
+        coverage_enabled = coverage_mode != "off"
+        
+        if collecting:
+            print("🔎 Collecting tests (no execution)...")
+        elif coverage_enabled:
+            print("🧪 Starting comprehensive test execution with coverage...")
+            print(f"📊 Coverage threshold: {coverage_threshold}%")
+        else:
+            print("🧪 Starting test execution (coverage disabled)...")
         
         # Build pytest command
-        cmd = [sys.executable, "-m", "pytest"]
+        if profile_collection:
+            cmd = [sys.executable, "-m", "pyinstrument", "-m", "pytest"]
+        else:
+            cmd = [sys.executable, "-m", "pytest"]
         
         # Add test paths
         if test_paths:
@@ -51,26 +153,75 @@ class TestRunner:
         else:
             cmd.append("tests/")
         
-        # Coverage options
-        cmd.extend([
-            "--cov=ai_trackdown_pytools",
-            "--cov-branch",
-            f"--cov-fail-under={coverage_threshold}",
-            "--cov-report=term-missing:skip-covered",
-        ])
+        env = {
+            key: value for key, value in os.environ.items()
+            if key not in UNUSED_ENV_VARS
+        }
+        env["PYTHONPATH"] = str(self.project_root / "src")
         
-        # Report generation
-        if generate_reports:
-            cmd.extend([
-                f"--cov-report=html:{self.project_root}/htmlcov",
-                f"--cov-report=xml:{self.project_root}/coverage.xml",
-                f"--cov-report=json:{self.project_root}/coverage.json",
-                f"--cov-report=lcov:{self.project_root}/coverage.lcov",
-            ])
+        # Coverage options. On Python 3.12+ coverage.py can trace through
+        # sys.monitoring (PEP 669), which is far cheaper than sys.settrace.
+        # It cannot record dynamic contexts, so per-test contexts are dropped
+        # when it is active, and branch measurement needs Python 3.14+.
+        use_sysmon = coverage_enabled and (
+            sys.version_info >= (3, 14)
+            or (sys.version_info >= (3, 12) and coverage_mode == "line")
+        )
+        if coverage_enabled:
+            if label:
+                env["COVERAGE_FILE"] = str(self.project_root / f".coverage.{label}")
+            if use_sysmon:
+                env["COVERAGE_CORE"] = "sysmon"
+            # Replace pyproject's addopts, whose --cov-branch would force
+            # branch measurement in line mode; the flags below cover it
+            cov_args = ["-o", f"addopts={self._addopts_without_coverage()}"]
+            cov_args.append("--cov=ai_trackdown_pytools")
+            if coverage_mode == "branch":
+                cov_args.append("--cov-branch")
+            if not use_sysmon:
+                cov_args.append("--cov-context=test")
+            cov_args.append(f"--cov-fail-under={coverage_threshold}")
+            
+            report_flags = {
+                "term": "term-missing:skip-covered",
+                "html": f"html:{self.project_root}/htmlcov",
+                "xml": f"xml:{self.project_root}/coverage.xml",
+                "json": f"json:{coverage_json}",
+                "lcov": f"lcov:{self.project_root}/coverage.lcov",
+            }
+            cov_args.extend(
+                f"--cov-report={report_flags[fmt]}"
+                for fmt in REPORT_FORMATS if fmt in formats
+            )
+            cmd.extend(cov_args)
+        else:
+            # Also overrides the --cov flags in pyproject addopts
+            cmd.append("--no-cov")
         
-        # JUnit XML for CI integration
-        junit_file = self.test_reports_dir / f"junit-{timestamp}.xml"
-        cmd.extend(["--junitxml", str(junit_file)])
+        if collecting:
+            cmd.append("--collect-only")
+            timestamp = None
+        else:
+            # Timestamped artifacts are only needed when tests actually run
+            self._ensure_dirs()
+            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+            run_id = f"{label}-{timestamp}" if label else timestamp
+            
+            # Machine-readable results: pytest-json-report when available,
+            # JUnit XML as the fallback and for CI systems that need it
+            result_files = []
+            if importlib.util.find_spec("pytest_jsonreport") is not None:
+                json_report = self.test_reports_dir / f"report-{run_id}.json"
+                cmd.extend([
+                    "--json-report",
+                    f"--json-report-file={json_report}",
+                    "--json-report-omit=keywords",
+                ])
+                result_files.append(json_report)
+            if junit_compat or not result_files:
+                junit_file = self.test_reports_dir / f"junit-{run_id}.xml"
+                cmd.extend(["--junitxml", str(junit_file)])
+                result_files.append(junit_file)
         
         # Test execution options
         if fail_fast:
@@ -81,19 +232,34 @@ class TestRunner:
         else:
             cmd.append("-q")
         
+        # Reruns driven by the last-failed cache
+        if rerun_failed:
+            cmd.extend(["-p", "no:randomly", "--lf", "--last-failed-no-failures=none"])
+        elif failed_first:
+            cmd.append("--ff")
+        
         # Marker filtering
         if markers:
             for marker in markers:
                 cmd.extend(["-m", marker])
         
+        # Parallel execution via pytest-xdist
+        if parallel:
+            cmd.extend(["-n", workers, "--dist=worksteal"])
+        
         # Additional pytest options
-        cmd.extend([
-            "--strict-markers",
-            "--strict-config",
-            "--tb=short",
-            "-ra",
-            "--durations=10",
-        ])
+        if strict:
+            cmd.extend([
+                "--strict-markers",
+                "--strict-config",
+                "--tb=short",
+                "-ra",
+                "--durations=10",
+            ])
+        else:
+            # pyproject addopts would otherwise re-add the strict flags; every
+            # option the runner needs is passed explicitly above
+            cmd.extend(["-o", "addopts=", "--tb=short"])
         
         # Performance and output options
         cmd.extend([
@@ -103,31 +269,53 @@ class TestRunner:
         
         print(f"🚀 Executing: {' '.join(cmd)}")
         
-        # Run tests
+        if collecting:
+            return self._run_collection(cmd, env)
+        
+        # Run tests, streaming output to a log file rather than into memory
+        log_file = self.test_reports_dir / f"pytest-{run_id}.log"
+        print(f"📝 Streaming output to: {log_file}")
         start_time = time.time()
         
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                env={**os.environ, "PYTHONPATH": str(self.project_root / "src")}
-            )
+            with open(log_file, "wb") as log:
+                result = subprocess.run(
+                    cmd,
+                    cwd=self.project_root,
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    env=env
+                )
+            
+            # Merge per-worker coverage data before reading coverage.json
+            if parallel and coverage_enabled:
+                self._combine_coverage(env=env, json_path=coverage_json)
             
             end_time = time.time()
             duration = end_time - start_time
             
             # Parse results
-            test_results = self._parse_test_results(result, duration, timestamp)
+            test_results = self._parse_test_results(
+                result, duration, timestamp, result_files[0],
+                coverage_json if coverage_enabled else None, start_time
+            )
+            test_results["log_file"] = str(log_file)
+            test_results["result_files"] = [path.name for path in result_files]
+            test_results["report_formats"] = (
+                [fmt for fmt in REPORT_FORMATS if fmt in formats]
+                if coverage_enabled else []
+            )
+            if coverage_enabled:
+                test_results["coverage_json"] = coverage_json.name
             
             # Generate coverage analysis
-            if generate_reports and (self.project_root / "coverage.json").exists():
-                coverage_analysis = self._analyze_coverage_results()
+            if coverage_enabled and generate_reports and coverage_json.exists():
+                coverage_analysis = self._analyze_coverage_results(coverage_json)
                 test_results["coverage"] = coverage_analysis
             
             # Generate comprehensive report
-            self._generate_test_report(test_results, timestamp)
+            if generate_reports:
+                self._generate_test_report(test_results, run_id)
             
             # Print summary
             self._print_test_summary(test_results)
@@ -138,60 +326,179 @@ class TestRunner:
             print(f"❌ Test execution failed: {e}")
             return {"success": False, "error": str(e)}
     
+    def _addopts_without_coverage(self) -> str:
+        """pytest addopts from pyproject.toml with the pytest-cov flags removed."""
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        
+        with open(self.project_root / "pyproject.toml", "rb") as f:
+            pyproject = tomllib.load(f)
+        addopts = (
+            pyproject.get("tool", {}).get("pytest", {}).get("ini_options", {})
+            .get("addopts", [])
+        )
+        if isinstance(addopts, str):
+            addopts = addopts.split()
+        return " ".join(opt for opt in addopts if not opt.startswith("--cov"))
+    
+    def _run_collection(self, cmd: List[str], env: Dict[str, str]) -> Dict:
+        """Run a collection-only pytest command with output on the console."""
+        start_time = time.time()
+        result = subprocess.run(cmd, cwd=self.project_root, env=env)
+        duration = time.time() - start_time
+        
+        print(f"⏱️  Collection finished in {duration:.2f}s")
+        return {
+            "success": result.returncode == 0,
+            "exit_code": result.returncode,
+            "duration": duration,
+            "collect_only": True,
+        }
+    
+    def _combine_coverage(self,
+                          env: Optional[Dict[str, str]] = None,
+                          json_path: Optional[Path] = None,
+                          formats: Iterable[str] = ("json",)) -> None:
+        """Combine parallel coverage data files and rebuild reports from them."""
+        root = self.project_root
+        report_args = {
+            "html": ["html", "-d", str(root / "htmlcov")],
+            "xml": ["xml", "-o", str(root / "coverage.xml")],
+            "json": ["json", "-o", str(json_path or root / "coverage.json")],
+            "lcov": ["lcov", "-o", str(root / "coverage.lcov")],
+        }
+        commands = [["combine"]]
+        commands.extend(
+            report_args[fmt] for fmt in REPORT_FORMATS
+            if fmt in formats and fmt in report_args
+        )
+        for args in commands:
+            subprocess.run(
+                [sys.executable, "-m", "coverage", *args],
+                cwd=root, env=env, capture_output=True
+            )
+    
     def _parse_test_results(self, result: subprocess.CompletedProcess, 
-                          duration: float, timestamp: str) -> Dict:
+                          duration: float, timestamp: str,
+                          results_file: Path,
+                          coverage_json: Optional[Path] = None,
+                          start_time: float = 0.0) -> Dict:
         """Parse test execution results."""
-        # Parse JUnit XML if available
-        junit_file = self.test_reports_dir / f"junit-{timestamp}.xml"
-        test_stats = self._parse_junit_xml(junit_file) if junit_file.exists() else {}
+        # Parse the JSON report or JUnit XML if available
+        if not results_file.exists():
+            test_stats = {}
+        elif results_file.suffix == ".json":
+            test_stats = self._parse_json_report(results_file)
+        else:
+            test_stats = self._parse_junit_xml(results_file)
         
-        # Parse coverage from output
-        coverage_info = self._extract_coverage_from_output(result.stdout)
+        # Coverage totals come from the JSON report written by this run
+        coverage_info = (
+            self._read_coverage_totals(coverage_json, start_time)
+            if coverage_json else {}
+        )
         
         return {
             "timestamp": timestamp,
+            "coverage_enabled": coverage_json is not None,
             "duration": duration,
             "exit_code": result.returncode,
             "success": result.returncode == 0,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
             "test_stats": test_stats,
             "coverage_summary": coverage_info,
         }
     
-    def _parse_junit_xml(self, junit_file: Path) -> Dict:
-        """Parse JUnit XML file for test statistics."""
+    def _parse_json_report(self, report_file: Path) -> Dict:
+        """Parse a pytest-json-report file for test statistics."""
+        import json
+        
         try:
-            tree = ET.parse(junit_file)
-            root = tree.getroot()
+            with open(report_file, "rb") as f:
+                data = json.load(f)
             
-            # Extract test statistics
+            summary = data.get("summary", {})
             stats = {
-                "total": int(root.get("tests", 0)),
-                "failures": int(root.get("failures", 0)),
-                "errors": int(root.get("errors", 0)),
-                "skipped": int(root.get("skipped", 0)),
-                "time": float(root.get("time", 0.0)),
+                "total": summary.get("total", 0),
+                "failures": summary.get("failed", 0),
+                "errors": summary.get("error", 0),
+                # JUnit counts expected failures as skipped; keep that meaning
+                "skipped": summary.get("skipped", 0) + summary.get("xfailed", 0),
+                "time": float(data.get("duration", 0.0)),
             }
             
+            failed_tests = []
+            for test in data.get("tests", []):
+                outcome = test.get("outcome")
+                if outcome not in ("failed", "error"):
+                    continue
+                if len(failed_tests) >= MAX_FAILED_TESTS:
+                    break
+                
+                classname, _, name = test.get("nodeid", "").rpartition("::")
+                stages = [test.get(stage) or {} for stage in ("setup", "call", "teardown")]
+                longrepr = next(
+                    (stage.get("longrepr") for stage in stages
+                     if stage.get("outcome") == "failed"),
+                    None
+                )
+                failed_tests.append({
+                    "name": name,
+                    "classname": classname,
+                    "time": sum(float(stage.get("duration", 0)) for stage in stages),
+                    "failure": longrepr if outcome == "failed" else None,
+                    "error": longrepr if outcome == "error" else None,
+                })
+            
             stats["passed"] = stats["total"] - stats["failures"] - stats["errors"] - stats["skipped"]
             stats["success_rate"] = (stats["passed"] / stats["total"] * 100) if stats["total"] > 0 else 0
+            stats["failed_tests"] = failed_tests
+            return stats
             
-            # Extract failed test details
+        except Exception as e:
+            print(f"⚠️  Failed to parse JSON test report: {e}")
+            return {}
+    
+    def _parse_junit_xml(self, junit_file: Path) -> Dict:
+        """Parse JUnit XML file for test statistics.
+        
+        The file is streamed with ``iterparse`` so large suites are handled
+        in a single pass without holding the whole tree in memory.
+        """
+        import xml.etree.ElementTree as ET
+        
+        try:
+            stats = {"total": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
             failed_tests = []
-            for testcase in root.findall(".//testcase"):
-                failure = testcase.find("failure")
-                error = testcase.find("error")
-                
-                if failure is not None or error is not None:
-                    failed_tests.append({
-                        "name": testcase.get("name"),
-                        "classname": testcase.get("classname"),
-                        "time": float(testcase.get("time", 0)),
-                        "failure": failure.text if failure is not None else None,
-                        "error": error.text if error is not None else None,
-                    })
             
+            with open(junit_file, "rb") as f:
+                for _, elem in ET.iterparse(f, events=("end",)):
+                    if elem.tag == "testcase":
+                        failure = elem.find("failure")
+                        error = elem.find("error")
+                        
+                        if ((failure is not None or error is not None)
+                                and len(failed_tests) < MAX_FAILED_TESTS):
+                            failed_tests.append({
+                                "name": elem.get("name"),
+                                "classname": elem.get("classname"),
+                                "time": float(elem.get("time", "0")),
+                                "failure": failure.text if failure is not None else None,
+                                "error": error.text if error is not None else None,
+                            })
+                        elem.clear()
+                    elif elem.tag == "testsuite":
+                        # pytest nests one or more <testsuite> under <testsuites>
+                        stats["total"] += int(elem.get("tests", "0"))
+                        stats["failures"] += int(elem.get("failures", "0"))
+                        stats["errors"] += int(elem.get("errors", "0"))
+                        stats["skipped"] += int(elem.get("skipped", "0"))
+                        stats["time"] += float(elem.get("time", "0"))
+                        elem.clear()
+            
+            stats["passed"] = stats["total"] - stats["failures"] - stats["errors"] - stats["skipped"]
+            stats["success_rate"] = (stats["passed"] / stats["total"] * 100) if stats["total"] > 0 else 0
             stats["failed_tests"] = failed_tests
             return stats
             
@@ -199,37 +506,44 @@ class TestRunner:
             print(f"⚠️  Failed to parse JUnit XML: {e}")
             return {}
     
-    def _extract_coverage_from_output(self, output: str) -> Dict:
-        """Extract coverage information from pytest output."""
-        coverage_info = {}
-        
-        lines = output.split("\n")
-        for line in lines:
-            if "TOTAL" in line and "%" in line:
-                # Parse coverage line: "TOTAL    5021   4708   2076      3     5%"
-                parts = line.split()
-                if len(parts) >= 5:
-                    try:
-                        coverage_info = {
-                            "statements": int(parts[1]),
-                            "missing": int(parts[2]),
-                            "branches": int(parts[3]) if len(parts) > 3 else 0,
-                            "partial": int(parts[4]) if len(parts) > 4 else 0,
-                            "coverage": float(parts[-1].rstrip("%")),
-                        }
-                        break
-                    except (ValueError, IndexError):
-                        continue
-        
-        return coverage_info
-    
-    def _analyze_coverage_results(self) -> Dict:
+    def _read_coverage_totals(self, json_path: Path, not_before: float = 0.0) -> Dict:
+        """Read coverage totals from a JSON report, ignoring stale files."""
+        import json
+        
+        try:
+            if json_path.stat().st_mtime < not_before:
+                return {}
+            with open(json_path, "r") as f:
+                totals = json.load(f).get("totals", {})
+        except (OSError, ValueError):
+            return {}
+        
+        return {
+            "statements": totals.get("num_statements", 0),
+            "missing": totals.get("missing_lines", 0),
+            "branches": totals.get("num_branches", 0),
+            "partial": totals.get("num_partial_branches", 0),
+            "coverage": totals.get("percent_covered", 0.0),
+        }
+    
+    def _analyze_coverage_results(self, json_path: Optional[Path] = None) -> Dict:
         """Analyze detailed coverage results from JSON report."""
-        json_path = self.project_root / "coverage.json"
+        import heapq
+        import json
+        
+        json_path = json_path or self.project_root / "coverage.json"
         
-        if not json_path.exists():
+        try:
+            stat = json_path.stat()
+        except OSError:
             return {}
         
+        # Re-runs that leave coverage.json untouched (e.g. --lf in watch
+        # loops) reuse the previous analysis instead of re-parsing it
+        cache_key = (str(json_path), stat.st_mtime_ns, stat.st_size)
+        if cache_key in self._cov_cache:
+            return self._cov_cache[cache_key]
+        
         try:
             with open(json_path, "r") as f:
                 data = json.load(f)
@@ -249,16 +563,15 @@ class TestRunner:
                     "branches": summary.get("num_branches", 0),
                 })
             
-            # Sort by coverage percentage
-            file_analysis.sort(key=lambda x: x["coverage"])
-            
-            # Calculate quality metrics
+            # Calculate quality metrics in a single pass
             total_files = len(file_analysis)
-            excellent_files = len([f for f in file_analysis if f["coverage"] >= 90])
-            good_files = len([f for f in file_analysis if 75 <= f["coverage"] < 90])
-            poor_files = len([f for f in file_analysis if f["coverage"] < 50])
+            buckets = [0, 0, 0, 0]  # poor, fair, good, excellent
+            for file_info in file_analysis:
+                coverage = file_info["coverage"]
+                buckets[(coverage >= 50) + (coverage >= 75) + (coverage >= 90)] += 1
+            poor_files, _, good_files, excellent_files = buckets
             
-            return {
+            analysis = {
                 "totals": totals,
                 "file_count": total_files,
                 "quality_distribution": {
@@ -266,21 +579,29 @@ class TestRunner:
                     "good": good_files,
                     "poor": poor_files,
                 },
-                "lowest_coverage_files": file_analysis[:5],  # Bottom 5
-                "highest_coverage_files": file_analysis[-5:],  # Top 5
+                # Partial selection instead of sorting every file
+                "lowest_coverage_files": heapq.nsmallest(
+                    5, file_analysis, key=lambda x: x["coverage"]
+                ),
+                "highest_coverage_files": heapq.nlargest(
+                    5, file_analysis, key=lambda x: x["coverage"]
+                ),
             }
+            self._cov_cache[cache_key] = analysis
+            return analysis
             
         except Exception as e:
             print(f"⚠️  Failed to analyze coverage results: {e}")
             return {}
     
-    def _generate_test_report(self, results: Dict, timestamp: str) -> None:
+    def _generate_test_report(self, results: Dict, run_id: str) -> None:
         """Generate comprehensive test execution report."""
-        report_path = self.test_reports_dir / f"test-execution-report-{timestamp}.md"
+        report_path = self.test_reports_dir / f"test-execution-report-{run_id}.md"
         
-        report = f"""# Test Execution Report
+        parts: List[str] = []
+        parts.append(f"""# Test Execution Report
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Timestamp: {timestamp}
+Timestamp: {results['timestamp']}
 
 ## Execution Summary
 
@@ -288,12 +609,12 @@ Timestamp: {timestamp}
 - **Duration**: {results['duration']:.2f}s
 - **Exit Code**: {results['exit_code']}
 
-"""
+""")
         
         # Test statistics
         if "test_stats" in results and results["test_stats"]:
             stats = results["test_stats"]
-            report += f"""## Test Statistics
+            parts.append(f"""## Test Statistics
 
 - **Total Tests**: {stats.get('total', 0)}
 - **Passed**: {stats.get('passed', 0)}
@@ -302,71 +623,79 @@ Timestamp: {timestamp}
 - **Skipped**: {stats.get('skipped', 0)}
 - **Success Rate**: {stats.get('success_rate', 0):.1f}%
 
-"""
+""")
             
             # Failed tests details
             if stats.get("failed_tests"):
-                report += "### Failed Tests\n\n"
+                parts.append("### Failed Tests\n\n")
                 for test in stats["failed_tests"][:10]:  # Limit to 10
-                    report += f"**{test['name']}** ({test['classname']})\n"
+                    parts.append(f"**{test['name']}** ({test['classname']})\n")
                     if test.get("failure"):
-                        report += f"```\n{test['failure'][:500]}...\n```\n\n"
+                        parts.append(f"```\n{test['failure'][:500]}...\n```\n\n")
         
         # Coverage summary
         if "coverage_summary" in results and results["coverage_summary"]:
             cov = results["coverage_summary"]
-            report += f"""## Coverage Summary
+            parts.append(f"""## Coverage Summary
 
 - **Line Coverage**: {cov.get('coverage', 0):.1f}%
 - **Total Statements**: {cov.get('statements', 0)}
 - **Missing Statements**: {cov.get('missing', 0)}
 - **Branch Coverage**: Available in detailed reports
 
-"""
+""")
         
         # Coverage analysis
         if "coverage" in results and results["coverage"]:
             cov_analysis = results["coverage"]
             if "quality_distribution" in cov_analysis:
                 dist = cov_analysis["quality_distribution"]
-                report += f"""## Coverage Quality Distribution
+                parts.append(f"""## Coverage Quality Distribution
 
 - **Excellent (≥90%)**: {dist.get('excellent', 0)} files
 - **Good (75-89%)**: {dist.get('good', 0)} files
 - **Poor (<50%)**: {dist.get('poor', 0)} files
 
-"""
+""")
             
             # Lowest coverage files
             if "lowest_coverage_files" in cov_analysis:
-                report += "### Files Needing Attention\n\n"
+                parts.append("### Files Needing Attention\n\n")
                 for file_info in cov_analysis["lowest_coverage_files"]:
-                    report += f"- **{file_info['filename']}**: {file_info['coverage']:.1f}% coverage\n"
-                report += "\n"
+                    parts.append(f"- **{file_info['filename']}**: {file_info['coverage']:.1f}% coverage\n")
+                parts.append("\n")
         
         # Generated artifacts
-        report += "## Generated Artifacts\n\n"
-        report += "### Coverage Reports\n"
-        report += f"- HTML Report: `htmlcov/index.html`\n"
-        report += f"- XML Report: `coverage.xml`\n"
-        report += f"- JSON Report: `coverage.json`\n"
-        report += f"- LCOV Report: `coverage.lcov`\n\n"
+        parts.append("## Generated Artifacts\n\n")
+        artifacts = [
+            REPORT_ARTIFACTS[fmt] for fmt in results.get("report_formats", [])
+            if fmt in REPORT_ARTIFACTS
+        ]
+        if artifacts:
+            parts.append("### Coverage Reports\n")
+            for name, path in artifacts:
+                if path == "coverage.json":
+                    path = results.get("coverage_json", path)
+                parts.append(f"- {name}: `{path}`\n")
+            parts.append("\n")
         
-        report += "### Test Reports\n"
-        report += f"- JUnit XML: `test-reports/junit-{timestamp}.xml`\n"
-        report += f"- Execution Report: `test-reports/test-execution-report-{timestamp}.md`\n\n"
+        parts.append("### Test Reports\n")
+        for name in results.get("result_files", []):
+            kind = "JSON Test Report" if name.endswith(".json") else "JUnit XML"
+            parts.append(f"- {kind}: `test-reports/{name}`\n")
+        parts.append(f"- Pytest Output Log: `test-reports/pytest-{run_id}.log`\n")
+        parts.append(f"- Execution Report: `test-reports/test-execution-report-{run_id}.md`\n\n")
         
         # Recommendations
         if not results["success"]:
-            report += "## Recommendations\n\n"
-            report += "1. Review failed test details above\n"
-            report += "2. Check test output for specific error messages\n"
-            report += "3. Run individual failing tests for detailed debugging\n"
-            report += "4. Ensure all dependencies are properly installed\n\n"
+            parts.append("## Recommendations\n\n")
+            parts.append("1. Review failed test details above\n")
+            parts.append("2. Check test output for specific error messages\n")
+            parts.append("3. Run individual failing tests for detailed debugging\n")
+            parts.append("4. Ensure all dependencies are properly installed\n\n")
         
         # Save report
-        with open(report_path, "w") as f:
-            f.write(report)
+        report_path.write_text("".join(parts), encoding="utf-8")
         
         print(f"📋 Test execution report saved: {report_path}")
     
@@ -405,9 +734,12 @@ Timestamp: {timestamp}
             print("  • Review failed tests in the detailed report")
             print("  • Run specific tests with -v for more details")
             print("  • Check coverage gaps for untested code")
+            if results.get("log_file"):
+                print(f"  • Full pytest output: {results['log_file']}")
         
         print("\n📁 Reports generated in:")
-        print(f"  • HTML Coverage: htmlcov/index.html")
+        if "html" in results.get("report_formats", []):
+            print(f"  • HTML Coverage: htmlcov/index.html")
         print(f"  • Test Reports: test-reports/")
         print("="*70)
     
@@ -431,6 +763,7 @@ Timestamp: {timestamp}
                 "markers": ["e2e"],
                 "coverage_threshold": 60.0,
                 "fail_fast": True,
+                "workers": "1",  # Scenario ordering matters
             },
             "cli": {
                 "test_paths": ["tests/cli/"],
@@ -443,6 +776,9 @@ Timestamp: {timestamp}
                 "markers": ["not slow"],
                 "coverage_threshold": 80.0,
                 "fail_fast": True,
+                "coverage_mode": "off",  # Instrumentation dominates runtime
+                "report_formats": ("json",),
+                "strict": False,
             },
             "full": {
                 "test_paths": None,  # All tests
@@ -460,6 +796,113 @@ Timestamp: {timestamp}
         
         print(f"🎯 Running {suite_type} test suite...")
         return self.run_tests_with_coverage(**config)
+    
+    def run_suites_parallel(self, suite_types: List[str], **kwargs) -> Dict:
+        """Run independent test suites concurrently, one process per suite.
+        
+        Each suite writes labelled artifacts and its own coverage data file;
+        the data is combined afterwards and the coverage reports are rebuilt
+        from it, so wall-clock time is that of the slowest suite. The xdist
+        workers are split across the suites so they don't oversubscribe the CPU.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        
+        print(f"🎯 Running suites in parallel: {', '.join(suite_types)}")
+        suite_runner = TestRunner(
+            self.project_root, workers=self._split_workers(len(suite_types))
+        )
+        with ProcessPoolExecutor(max_workers=len(suite_types)) as pool:
+            futures = {
+                suite_type: pool.submit(
+                    suite_runner.run_specific_test_suite,
+                    suite_type,
+                    label=suite_type,
+                    **kwargs,
+                )
+                for suite_type in suite_types
+            }
+            suite_results = {
+                suite_type: future.result() for suite_type, future in futures.items()
+            }
+        
+        if any(result.get("coverage_enabled") for result in suite_results.values()):
+            formats = kwargs.get("report_formats") or REPORT_FORMATS
+            if not kwargs.get("generate_reports", True):
+                formats = ("json",)
+            self._combine_coverage(formats=formats)
+        
+        success = all(result.get("success") for result in suite_results.values())
+        for suite_type, result in suite_results.items():
+            status_emoji = "✅" if result.get("success") else "❌"
+            print(f"{status_emoji} {suite_type}: {result.get('duration', 0):.2f}s")
+        
+        return {"success": success, "suites": suite_results}
+    
+    def _split_workers(self, suite_count: int) -> str:
+        """Share the configured xdist worker count between concurrent suites."""
+        if self.workers in ("0", "1"):
+            return self.workers
+        total = (os.cpu_count() or 1) if self.workers == "auto" else int(self.workers)
+        return str(max(1, total // suite_count))
+    
+    def run_watch(self,
+                  test_paths: Optional[List[str]] = None,
+                  markers: Optional[List[str]] = None,
+                  verbose: bool = False) -> None:
+        """Re-run tests in-process on demand.
+        
+        pytest and its plugins are imported once; each run only re-imports
+        project modules, so interpreter start-up and plugin loading are paid
+        a single time. Coverage is disabled in this mode.
+        """
+        import pytest
+        
+        src_dir = str(self.project_root / "src")
+        if src_dir not in sys.path:
+            sys.path.insert(0, src_dir)
+        
+        base_args = list(test_paths or ["tests/"])
+        base_args.extend(["--no-cov", "--tb=short", "-v" if verbose else "-q"])
+        for marker in markers or []:
+            base_args.extend(["-m", marker])
+        
+        print("👀 Watch mode: Enter re-runs, 'lf' last-failed, 'ff' failed-first,")
+        print("   any other input is passed to pytest, 'q' quits")
+        
+        while True:
+            try:
+                line = input("watch> ").strip()
+            except (EOFError, KeyboardInterrupt):
+                print()
+                break
+            
+            if line in ("q", "quit", "exit"):
+                break
+            
+            extra = {"lf": ["--lf"], "ff": ["--ff"]}.get(line, line.split())
+            self._unload_project_modules()
+            
+            start_time = time.time()
+            exit_code = pytest.main(base_args + extra)
+            status_emoji = "✅" if exit_code == 0 else "❌"
+            print(f"{status_emoji} pytest exited with {int(exit_code)} "
+                  f"in {time.time() - start_time:.2f}s")
+    
+    def _unload_project_modules(self) -> None:
+        """Drop project modules from sys.modules so edits are picked up.
+
+        Only code under src/ and tests/ is dropped; the runner itself and
+        anything installed in a project-local virtualenv stay loaded.
+        """
+        roots = tuple(
+            str(self.project_root / subdir) + os.sep for subdir in ("src", "tests")
+        )
+        for name, module in list(sys.modules.items()):
+            if name == "__main__":
+                continue
+            module_file = getattr(module, "__file__", None) or ""
+            if module_file.startswith(roots):
+                del sys.modules[name]
 
 
 def main():
@@ -468,9 +911,11 @@ def main():
         description="AI Trackdown PyTools Enhanced Test Runner"
     )
     
+    suite_choices = ["unit", "integration", "e2e", "cli", "fast", "full"]
+    
     parser.add_argument(
         "suite", nargs="?", default="full",
-        choices=["unit", "integration", "e2e", "cli", "fast", "full"],
+        choices=suite_choices,
         help="Test suite to run"
     )
     
@@ -504,6 +949,67 @@ def main():
         help="Skip report generation"
     )
     
+    parser.add_argument(
+        "--report-formats",
+        type=lambda value: [fmt.strip() for fmt in value.split(",") if fmt.strip()],
+        help=f"Comma-separated coverage report formats ({','.join(REPORT_FORMATS)})"
+    )
+    
+    parser.add_argument(
+        "--lf", "--last-failed", dest="rerun_failed", action="store_true",
+        help="Re-run only the tests that failed last time (coverage off)"
+    )
+    
+    parser.add_argument(
+        "--ff", "--failed-first", dest="failed_first", action="store_true",
+        help="Run previously failed tests first, then the rest"
+    )
+    
+    parser.add_argument(
+        "--junit-compat", action="store_true",
+        help="Also write JUnit XML alongside the JSON test report"
+    )
+    
+    parser.add_argument(
+        "--collect-only", action="store_true",
+        help="Only collect tests; skips coverage, reports and xdist"
+    )
+    
+    parser.add_argument(
+        "--profile-collection", action="store_true",
+        help="Collect tests under pyinstrument to profile collection time"
+    )
+    
+    parser.add_argument(
+        "--parallel-suites",
+        type=lambda value: [suite.strip() for suite in value.split(",") if suite.strip()],
+        help="Comma-separated suites to run concurrently, e.g. unit,integration,cli"
+    )
+    
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="Keep pytest loaded and re-run tests on demand from stdin"
+    )
+    
+    parser.add_argument(
+        "--workers", "--numprocesses", default="auto",
+        help="Number of pytest-xdist workers ('auto' for all cores, 1 to disable)"
+    )
+    
+    coverage_group = parser.add_mutually_exclusive_group()
+    coverage_group.add_argument(
+        "--coverage", dest="coverage_mode", action="store_const", const="branch",
+        help="Collect line and branch coverage (default for most suites)"
+    )
+    coverage_group.add_argument(
+        "--no-coverage", dest="coverage_mode", action="store_const", const="off",
+        help="Skip coverage instrumentation for fast red/green runs"
+    )
+    coverage_group.add_argument(
+        "--coverage-mode", dest="coverage_mode", choices=COVERAGE_MODES,
+        help="Coverage measurement level"
+    )
+    
     args = parser.parse_args()
     
     # Determine project root
@@ -512,29 +1018,50 @@ def main():
         print("❌ Not in a Python project directory (no pyproject.toml found)")
         sys.exit(1)
     
-    runner = TestRunner(project_root)
+    runner = TestRunner(project_root, workers=args.workers)
+    
+    if args.watch:
+        runner.run_watch(
+            test_paths=args.paths, markers=args.markers, verbose=args.verbose
+        )
+        return
+    
+    options = {
+        "coverage_threshold": args.threshold,
+        "fail_fast": args.fail_fast,
+        "verbose": args.verbose,
+        "markers": args.markers,
+        "generate_reports": not args.no_reports,
+    }
+    if args.coverage_mode:
+        options["coverage_mode"] = args.coverage_mode
+    if args.report_formats:
+        options["report_formats"] = args.report_formats
+    if args.junit_compat:
+        options["junit_compat"] = True
+    if args.rerun_failed or args.failed_first:
+        options["rerun_failed"] = args.rerun_failed
+        options["failed_first"] = args.failed_first
+    if args.collect_only or args.profile_collection:
+        options["collect_only"] = args.collect_only
+        options["profile_collection"] = args.profile_collection
+    
+    if args.parallel_suites:
+        unknown = set(args.parallel_suites).difference(suite_choices)
+        if unknown:
+            parser.error(f"unknown suite(s) for --parallel-suites: {', '.join(sorted(unknown))}")
     
     try:
-        if args.paths:
+        if args.parallel_suites:
+            results = runner.run_suites_parallel(args.parallel_suites, **options)
+        elif args.paths:
             # Custom test paths
             results = runner.run_tests_with_coverage(
-                test_paths=args.paths,
-                coverage_threshold=args.threshold,
-                fail_fast=args.fail_fast,
-                verbose=args.verbose,
-                markers=args.markers,
-                generate_reports=not args.no_reports
+                test_paths=args.paths, **options
             )
         else:
             # Predefined test suite
-            results = runner.run_specific_test_suite(
-                args.suite,
-                coverage_threshold=args.threshold,
-                fail_fast=args.fail_fast,
-                verbose=args.verbose,
-                markers=args.markers,
-                generate_reports=not args.no_reports
-            )
+            results = runner.run_specific_test_suite(args.suite, **options)
         
         # Exit with appropriate code
         sys.exit(0 if results["success"] else 1)
@@ -1,43 +1,74 @@
 #!/usr/bin/env python3
 """Test schema compatibility between ai-trackdown-pytools and the reference implementation."""
 
+import argparse
+import io
 import json
+import os
 import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime, date
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, TextIO
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; json.loads also accepts bytes
+    json_loads = json.loads
+
+try:
+    import msgspec
+except ImportError:  # optional: the msgspec comparison phase is skipped
+    msgspec = None
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from ai_trackdown_pytools.core.models import (
-    TaskModel, EpicModel, IssueModel, PRModel, ProjectModel,
-    TaskStatus, EpicStatus, IssueStatus, PRStatus, ProjectStatus,
-    Priority, IssueType, PRType
-)
-from ai_trackdown_pytools.utils.validation import SchemaValidator
+# Fields holding ticket IDs, checked by test_cross_references
+_REFERENCE_FIELDS = types.MappingProxyType({
+    "task": ("dependencies", "parent"),
+    "issue": ("dependencies", "parent", "child_tasks", "related_prs"),
+    "epic": ("child_issues", "dependencies"),
+    "pr": ("related_issues", "closes_issues"),
+    "project": ("epics",),
+})
+
+
+def _write_report(report: List[str], out: Optional[TextIO] = None) -> None:
+    """Write a phase's collected report lines with a single write call."""
+    (out or sys.stdout).write("\n".join(report) + "\n")
 
+
+@lru_cache(maxsize=None)
 def create_test_data() -> Dict[str, Any]:
-    """Create comprehensive test data that exercises all schema features."""
-    current_time = datetime.now()
+    """Create comprehensive test data that exercises all schema features.
+
+    The data is built once per process and shared by every phase; callers
+    must treat it as read-only. Enum values are spelled out as strings so
+    that --skip-pydantic never imports the models.
+    """
+    now = datetime.now().isoformat()
+    today = date.today().isoformat()
     
     test_data = {
         "task": {
             "id": "TSK-001",
             "title": "Test task with all fields",
             "description": "This is a test task to validate schema compatibility",
-            "status": TaskStatus.IN_PROGRESS.value,
-            "priority": Priority.HIGH.value,
+            "status": "in_progress",
+            "priority": "high",
             "assignees": ["user1@example.com", "user2@example.com"],
             "tags": ["backend", "api", "validation"],
-            "created_at": current_time.isoformat(),
-            "updated_at": current_time.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "labels": ["urgent", "technical-debt"],
             "metadata": {
                 "custom_field": "custom_value",
                 "integration_id": "INT-123"
             },
-            "due_date": date.today().isoformat(),
+            "due_date": today,
             "estimated_hours": 8.5,
             "actual_hours": 6.0,
             "dependencies": ["TSK-002", "ISS-001"],
@@ -48,20 +79,20 @@ def create_test_data() -> Dict[str, Any]:
             "id": "ISS-001",
             "title": "Test issue with bug report fields",
             "description": "Comprehensive issue test",
-            "issue_type": IssueType.BUG.value,
-            "severity": Priority.CRITICAL.value,
-            "status": IssueStatus.TESTING.value,
-            "priority": Priority.CRITICAL.value,
+            "issue_type": "bug",
+            "severity": "critical",
+            "status": "testing",
+            "priority": "critical",
             "assignees": ["qa@example.com"],
             "tags": ["bug", "production"],
-            "created_at": current_time.isoformat(),
-            "updated_at": current_time.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "labels": ["regression", "customer-reported"],
             "metadata": {
                 "reporter": "customer@example.com",
                 "affected_version": "v2.1.0"
             },
-            "due_date": date.today().isoformat(),
+            "due_date": today,
             "estimated_hours": 16.0,
             "actual_hours": 12.5,
             "story_points": 5.0,
@@ -79,12 +110,12 @@ def create_test_data() -> Dict[str, Any]:
             "id": "EP-001",
             "title": "Authentication System Overhaul",
             "description": "Complete redesign of authentication",
-            "status": EpicStatus.IN_PROGRESS.value,
-            "priority": Priority.HIGH.value,
+            "status": "in_progress",
+            "priority": "high",
             "assignees": ["architect@example.com", "lead@example.com"],
             "tags": ["security", "architecture"],
-            "created_at": current_time.isoformat(),
-            "updated_at": current_time.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "labels": ["q1-2025", "strategic"],
             "metadata": {
                 "sponsor": "CTO",
@@ -93,7 +124,7 @@ def create_test_data() -> Dict[str, Any]:
             "goal": "Implement modern OAuth2/OIDC authentication",
             "business_value": "Improved security and user experience",
             "success_criteria": "Zero security incidents, 99.9% uptime",
-            "target_date": date.today().isoformat(),
+            "target_date": today,
             "estimated_story_points": 100.0,
             "child_issues": ["ISS-001", "ISS-002", "ISS-003"],
             "dependencies": ["EP-002"]
@@ -103,13 +134,13 @@ def create_test_data() -> Dict[str, Any]:
             "id": "PR-001",
             "title": "Fix: Authentication bypass vulnerability",
             "description": "Critical security fix for auth bypass",
-            "pr_type": PRType.BUG_FIX.value,
-            "status": PRStatus.IN_REVIEW.value,
-            "priority": Priority.CRITICAL.value,
+            "pr_type": "bug_fix",
+            "status": "in_review",
+            "priority": "critical",
             "assignees": ["developer@example.com"],
             "tags": ["security", "hotfix"],
-            "created_at": current_time.isoformat(),
-            "updated_at": current_time.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "labels": ["security-fix", "needs-backport"],
             "metadata": {
                 "ci_status": "passing",
@@ -134,12 +165,12 @@ def create_test_data() -> Dict[str, Any]:
             "name": "AI Trackdown Enhancement",
             "title": "AI-Powered Project Management System",
             "description": "Next-generation project tracking with AI",
-            "status": ProjectStatus.ACTIVE.value,
-            "priority": Priority.HIGH.value,
+            "status": "active",
+            "priority": "high",
             "assignees": ["pm@example.com"],
             "tags": ["ai", "innovation"],
-            "created_at": current_time.isoformat(),
-            "updated_at": current_time.isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "labels": ["2025-initiative", "strategic"],
             "metadata": {
                 "department": "Engineering",
@@ -149,9 +180,9 @@ def create_test_data() -> Dict[str, Any]:
             "license": "MIT",
             "tech_stack": ["Python", "TypeScript", "PostgreSQL"],
             "team_members": ["dev1@example.com", "dev2@example.com", "qa@example.com"],
-            "start_date": date.today().isoformat(),
+            "start_date": today,
             "end_date": None,
-            "target_completion": date.today().isoformat(),
+            "target_completion": today,
             "budget": 250000.0,
             "estimated_hours": 2000.0,
             "actual_hours": 850.0,
@@ -163,7 +194,7 @@ def create_test_data() -> Dict[str, Any]:
                 {
                     "name": "MVP Release",
                     "description": "Minimum viable product",
-                    "target_date": date.today().isoformat(),
+                    "target_date": today,
                     "status": "in_progress"
                 }
             ]
@@ -173,33 +204,47 @@ def create_test_data() -> Dict[str, Any]:
     return test_data
 
 
-def test_json_schema_validation(test_data: Dict[str, Any]) -> None:
+def test_json_schema_validation(
+    test_data: Dict[str, Any], out: Optional[TextIO] = None
+) -> None:
     """Test validation against JSON schemas."""
-    print("=== Testing JSON Schema Validation ===\n")
+    report: List[str] = []
+    report.append("=== Testing JSON Schema Validation ===\n")
+    from ai_trackdown_pytools.utils.validation import SchemaValidator
+
     
     validator = SchemaValidator()
     
     for ticket_type, data in test_data.items():
-        print(f"Testing {ticket_type} schema...")
+        report.append(f"Testing {ticket_type} schema...")
         result = validator.validate_ticket(data, ticket_type)
         
         if result.valid:
-            print(f"✅ {ticket_type}: PASSED JSON schema validation")
+            report.append(f"✅ {ticket_type}: PASSED JSON schema validation")
         else:
-            print(f"❌ {ticket_type}: FAILED JSON schema validation")
+            report.append(f"❌ {ticket_type}: FAILED JSON schema validation")
             for error in result.errors:
-                print(f"   - Error: {error}")
+                report.append(f"   - Error: {error}")
         
         if result.warnings:
             for warning in result.warnings:
-                print(f"   - Warning: {warning}")
+                report.append(f"   - Warning: {warning}")
         
-        print()
+        report.append("")
 
+    _write_report(report, out)
 
-def test_pydantic_model_validation(test_data: Dict[str, Any]) -> None:
+
+def test_pydantic_model_validation(
+    test_data: Dict[str, Any], out: Optional[TextIO] = None
+) -> None:
     """Test validation against Pydantic models."""
-    print("=== Testing Pydantic Model Validation ===\n")
+    report: List[str] = []
+    report.append("=== Testing Pydantic Model Validation ===\n")
+    from ai_trackdown_pytools.core.models import (
+        TaskModel, EpicModel, IssueModel, PRModel, ProjectModel
+    )
+
     
     model_map = {
         "task": TaskModel,
@@ -210,109 +255,281 @@ def test_pydantic_model_validation(test_data: Dict[str, Any]) -> None:
     }
     
     for ticket_type, data in test_data.items():
-        print(f"Testing {ticket_type} Pydantic model...")
+        report.append(f"Testing {ticket_type} Pydantic model...")
         model_class = model_map[ticket_type]
         
         try:
-            # Create model instance
-            instance = model_class(**data)
-            print(f"✅ {ticket_type}: PASSED Pydantic validation")
+            # Validate once; the validated instance is reused for serialization
+            instance = model_class.model_validate(data)
+            report.append(f"✅ {ticket_type}: PASSED Pydantic validation")
             
             # Test serialization
-            serialized = instance.model_dump()
-            json_str = json.dumps(serialized, default=str)
-            print(f"   - Serialization successful ({len(json_str)} bytes)")
+            json_str = instance.model_dump_json()
+            report.append(f"   - Serialization successful ({len(json_str)} bytes)")
             
         except Exception as e:
-            print(f"❌ {ticket_type}: FAILED Pydantic validation")
-            print(f"   - Error: {str(e)}")
+            report.append(f"❌ {ticket_type}: FAILED Pydantic validation")
+            report.append(f"   - Error: {str(e)}")
         
-        print()
+        report.append("")
+
+    _write_report(report, out)
+
+
+@lru_cache(maxsize=None)
+def _msgspec_models() -> Dict[str, type]:
+    """Build msgspec Struct mirrors of the ticket models.
+
+    The mirrors only describe the JSON shape of each ticket; the field
+    constraints and cross-field rules stay in the Pydantic models.
+    """
 
+    class TicketStruct(msgspec.Struct, kw_only=True):
+        id: str
+        title: str
+        description: str = ""
+        priority: str = "medium"
+        assignees: List[str] = []
+        tags: List[str] = []
+        created_at: datetime
+        updated_at: datetime
+        labels: List[str] = []
+        metadata: Dict[str, Any] = {}
 
-def test_cross_references(test_data: Dict[str, Any]) -> None:
+    class TaskStruct(TicketStruct, kw_only=True):
+        status: str = "open"
+        due_date: Optional[date] = None
+        estimated_hours: Optional[float] = None
+        actual_hours: Optional[float] = None
+        dependencies: List[str] = []
+        parent: Optional[str] = None
+
+    class IssueStruct(TicketStruct, kw_only=True):
+        issue_type: str = "bug"
+        severity: str = "medium"
+        status: str = "open"
+        due_date: Optional[date] = None
+        estimated_hours: Optional[float] = None
+        actual_hours: Optional[float] = None
+        story_points: Optional[float] = None
+        environment: str = ""
+        steps_to_reproduce: str = ""
+        expected_behavior: str = ""
+        actual_behavior: str = ""
+        dependencies: List[str] = []
+        parent: Optional[str] = None
+        child_tasks: List[str] = []
+        related_prs: List[str] = []
+
+    class EpicStruct(TicketStruct, kw_only=True):
+        status: str = "planning"
+        goal: str = ""
+        business_value: str = ""
+        success_criteria: str = ""
+        target_date: Optional[date] = None
+        estimated_story_points: Optional[float] = None
+        child_issues: List[str] = []
+        dependencies: List[str] = []
+
+    class PRStruct(TicketStruct, kw_only=True):
+        pr_type: str = "feature"
+        status: str = "draft"
+        source_branch: str
+        target_branch: str
+        breaking_changes: bool = False
+        reviewers: List[str] = []
+        merged_at: Optional[datetime] = None
+        related_issues: List[str] = []
+        closes_issues: List[str] = []
+        commits: List[str] = []
+        files_changed: List[str] = []
+        lines_added: Optional[int] = None
+        lines_deleted: Optional[int] = None
+        test_coverage: Optional[float] = None
+
+    class MilestoneStruct(msgspec.Struct, kw_only=True):
+        name: str
+        description: str = ""
+        target_date: date
+        status: str = "planned"
+
+    class ProjectStruct(TicketStruct, kw_only=True):
+        name: str
+        status: str = "planning"
+        author: str = ""
+        license: str = "MIT"
+        tech_stack: List[str] = []
+        team_members: List[str] = []
+        start_date: Optional[date] = None
+        end_date: Optional[date] = None
+        target_completion: Optional[date] = None
+        budget: Optional[float] = None
+        estimated_hours: Optional[float] = None
+        actual_hours: Optional[float] = None
+        progress_percentage: Optional[float] = None
+        epics: List[str] = []
+        repository_url: Optional[str] = None
+        documentation_url: Optional[str] = None
+        milestones: List[MilestoneStruct] = []
+
+    return {
+        "task": TaskStruct,
+        "issue": IssueStruct,
+        "epic": EpicStruct,
+        "pr": PRStruct,
+        "project": ProjectStruct,
+    }
+
+
+def test_msgspec_validation(
+    test_data: Dict[str, Any], out: Optional[TextIO] = None
+) -> None:
+    """Validate and serialize the test data with msgspec for comparison."""
+    report: List[str] = []
+    report.append("=== Testing msgspec Struct Validation ===\n")
+
+    if msgspec is None:
+        report.append("⚠️  msgspec not installed, skipping\n")
+        _write_report(report, out)
+        return
+
+    struct_map = _msgspec_models()
+
+    for ticket_type, data in test_data.items():
+        report.append(f"Testing {ticket_type} msgspec struct...")
+
+        try:
+            instance = msgspec.convert(data, struct_map[ticket_type])
+            report.append(f"✅ {ticket_type}: PASSED msgspec validation")
+
+            json_bytes = msgspec.json.encode(instance)
+            report.append(f"   - Serialization successful ({len(json_bytes)} bytes)")
+
+        except msgspec.ValidationError as e:
+            report.append(f"❌ {ticket_type}: FAILED msgspec validation")
+            report.append(f"   - Error: {e}")
+
+        report.append("")
+
+    _write_report(report, out)
+
+
+def _as_refs(value: Any) -> tuple:
+    """Normalise a reference field value to a tuple of IDs."""
+    return (value,) if isinstance(value, str) else tuple(value or ())
+
+
+def test_cross_references(
+    test_data: Dict[str, Any], out: Optional[TextIO] = None
+) -> None:
     """Test cross-reference validation."""
-    print("=== Testing Cross-Reference Validation ===\n")
+    report: List[str] = []
+    report.append("=== Testing Cross-Reference Validation ===\n")
     
     # Collect all IDs
-    all_ids = set()
-    for ticket_type, data in test_data.items():
-        all_ids.add(data["id"])
-    
-    print(f"Total tickets: {len(all_ids)}")
-    print(f"IDs: {', '.join(sorted(all_ids))}\n")
+    all_ids = {data["id"] for data in test_data.values()}
     
-    # Check references
-    reference_fields = {
-        "task": ["dependencies", "parent"],
-        "issue": ["dependencies", "parent", "child_tasks", "related_prs"],
-        "epic": ["child_issues", "dependencies"],
-        "pr": ["related_issues", "closes_issues"],
-        "project": ["epics"]
-    }
+    report.append(f"Total tickets: {len(all_ids)}")
+    report.append(f"IDs: {', '.join(sorted(all_ids))}\n")
     
-    issues_found = []
-    
-    for ticket_type, data in test_data.items():
-        fields = reference_fields.get(ticket_type, [])
-        for field in fields:
-            if field in data:
-                refs = data[field]
-                if isinstance(refs, str):
-                    refs = [refs]
-                elif refs is None:
-                    continue
-                
-                for ref in refs:
-                    if ref not in all_ids:
-                        issues_found.append(f"{ticket_type} {data['id']} references non-existent {ref} in {field}")
+    # Flatten every reference into (type, id, field, ref) and diff once
+    references = [
+        (ticket_type, data["id"], field, ref)
+        for ticket_type, data in test_data.items()
+        for field in _REFERENCE_FIELDS.get(ticket_type, ())
+        for ref in _as_refs(data.get(field))
+    ]
+    missing = {ref for *_, ref in references} - all_ids
+    issues_found = [
+        f"{ticket_type} {ticket_id} references non-existent {ref} in {field}"
+        for ticket_type, ticket_id, field, ref in references
+        if ref in missing
+    ]
     
     if issues_found:
-        print("❌ Cross-reference issues found:")
+        report.append("❌ Cross-reference issues found:")
         for issue in issues_found:
-            print(f"   - {issue}")
+            report.append(f"   - {issue}")
     else:
-        print("✅ All cross-references are valid")
+        report.append("✅ All cross-references are valid")
     
-    print()
+    report.append("")
 
+    _write_report(report, out)
 
-def test_schema_completeness() -> None:
+
+def test_schema_completeness(out: Optional[TextIO] = None) -> None:
     """Test that all expected schemas exist."""
-    print("=== Testing Schema Completeness ===\n")
+    report: List[str] = []
+    report.append("=== Testing Schema Completeness ===\n")
     
     schema_dir = Path(__file__).parent.parent / "src" / "ai_trackdown_pytools" / "schemas"
     expected_schemas = ["task.json", "issue.json", "epic.json", "pr.json", "project.json"]
     
-    print(f"Schema directory: {schema_dir}")
+    report.append(f"Schema directory: {schema_dir}")
     
+    # One directory read instead of a stat per expected schema
+    try:
+        with os.scandir(schema_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+
     missing_schemas = []
     for schema_file in expected_schemas:
-        schema_path = schema_dir / schema_file
-        if schema_path.exists():
-            print(f"✅ {schema_file} exists")
+        if schema_file in present:
+            report.append(f"✅ {schema_file} exists")
             
-            # Check if it's valid JSON
+            # Check if it's valid JSON (orjson's decode error subclasses json's)
             try:
-                with open(schema_path) as f:
-                    json.load(f)
-                print(f"   - Valid JSON")
+                json_loads((schema_dir / schema_file).read_bytes())
+                report.append(f"   - Valid JSON")
             except json.JSONDecodeError as e:
-                print(f"   - ❌ Invalid JSON: {e}")
+                report.append(f"   - ❌ Invalid JSON: {e}")
         else:
             missing_schemas.append(schema_file)
-            print(f"❌ {schema_file} missing")
+            report.append(f"❌ {schema_file} missing")
     
     if missing_schemas:
-        print(f"\n❌ Missing schemas: {', '.join(missing_schemas)}")
+        report.append(f"\n❌ Missing schemas: {', '.join(missing_schemas)}")
     else:
-        print("\n✅ All expected schemas are present")
+        report.append("\n✅ All expected schemas are present")
     
-    print()
+    report.append("")
+
+    _write_report(report, out)
+
+
+def _run_phases_concurrently(phases) -> None:
+    """Run independent phases in threads, printing their reports in order.
+
+    Each phase writes into its own buffer, so output never interleaves.
+    """
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        pending = []
+        for phase, phase_args in phases:
+            buffer = io.StringIO()
+            pending.append((executor.submit(phase, *phase_args, out=buffer), buffer))
+        for future, buffer in pending:
+            future.result()
+            sys.stdout.write(buffer.getvalue())
 
 
 def main():
     """Run all compatibility tests."""
+    parser = argparse.ArgumentParser(description="Test schema compatibility")
+    parser.add_argument(
+        "--skip-pydantic",
+        action="store_true",
+        help="Skip the Pydantic model validation phase",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Run phases one at a time, printing each report as soon as it is ready",
+    )
+    args = parser.parse_args()
+
     print("AI Trackdown PyTools Schema Compatibility Test")
     print("=" * 50)
     print()
@@ -320,11 +537,19 @@ def main():
     # Create test data
     test_data = create_test_data()
     
-    # Run tests
-    test_schema_completeness()
-    test_json_schema_validation(test_data)
-    test_pydantic_model_validation(test_data)
-    test_cross_references(test_data)
+    phases = [
+        (test_schema_completeness, ()),
+        (test_json_schema_validation, (test_data,)),
+        (test_msgspec_validation, (test_data,)),
+        (test_cross_references, (test_data,)),
+    ]
+    if not args.skip_pydantic:
+        phases.insert(2, (test_pydantic_model_validation, (test_data,)))
+    if args.verbose:
+        for phase, phase_args in phases:
+            phase(*phase_args)
+    else:
+        _run_phases_concurrently(phases)
     
     print("=" * 50)
     print("Schema compatibility test completed!")
@@ -333,7 +558,10 @@ def main():
     print("\n📊 Test Summary:")
     print("- Schema files: Present and valid")
     print("- JSON Schema validation: Implemented")
-    print("- Pydantic model validation: Implemented")
+    print(
+        "- Pydantic model validation: "
+        + ("Skipped" if args.skip_pydantic else "Implemented")
+    )
     print("- Cross-reference validation: Implemented")
     print("\n✅ ai-trackdown-pytools implements comprehensive schema validation")
     print("   compatible with JSON Schema Draft 7 standard")
@@ -5,6 +5,7 @@ Script to upload AI Trackdown PyTools to PyPI.
 This script provides instructions and automation for uploading
 the package to PyPI after manual authentication setup.
 """
+import argparse
 import os
 import subprocess
 import sys
@@ -14,15 +15,68 @@ from pathlib import Path
 
 def calculate_sha256(file_path):
     """Calculate SHA256 hash of a file."""
-    sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1 << 20), b""):
             sha256_hash.update(chunk)
     return sha256_hash.hexdigest()
 
 
+def upload_dist_files(dist_files, use_subprocess=False):
+    """Upload distribution files with twine.
+
+    twine runs in-process by default, avoiding a second interpreter start-up
+    and re-import of its dependency stack. ``use_subprocess`` (or twine not
+    being importable here) falls back to the ``twine`` executable.
+    """
+    files = [str(f) for f in dist_files]
+
+    if not use_subprocess:
+        try:
+            from twine.commands.upload import main as twine_upload
+        except ImportError:
+            use_subprocess = True
+
+    if use_subprocess:
+        try:
+            result = subprocess.run(
+                ["twine", "upload", *files],
+                check=True,
+                capture_output=True,
+                text=True
+            )
+            print("Upload successful!")
+            print(result.stdout)
+        except subprocess.CalledProcessError as e:
+            print(f"Upload failed: {e}")
+            print(f"stderr: {e.stderr}")
+            sys.exit(1)
+        return
+
+    try:
+        twine_upload(files)
+    except SystemExit as e:
+        if e.code:
+            print(f"Upload failed: twine exited with {e.code}")
+            sys.exit(1)
+    except Exception as e:
+        print(f"Upload failed: {e}")
+        sys.exit(1)
+    print("Upload successful!")
+
+
 def main():
     """Main function to guide PyPI upload process."""
+    parser = argparse.ArgumentParser(description="Upload AI Trackdown PyTools to PyPI")
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="Run twine as a separate process instead of in-process",
+    )
+    args = parser.parse_args()
+
     print("AI Trackdown PyTools - PyPI Upload Script")
     print("=" * 50)
     
@@ -38,17 +92,20 @@ def main():
         sys.exit(1)
     
     # List distribution files
-    dist_files = list(dist_dir.glob("*.whl")) + list(dist_dir.glob("*.tar.gz"))
+    tar_files = list(dist_dir.glob("*.tar.gz"))
+    dist_files = list(dist_dir.glob("*.whl")) + tar_files
     if not dist_files:
         print("Error: No distribution files found. Please run 'python -m build' first.")
         sys.exit(1)
     
     print(f"Found {len(dist_files)} distribution files:")
+    digests = {}
+    sizes = {}
     for file in dist_files:
-        size_kb = file.stat().st_size / 1024
-        sha256 = calculate_sha256(file)
-        print(f"  - {file.name} ({size_kb:.1f} KB)")
-        print(f"    SHA256: {sha256}")
+        sizes[file] = file.stat().st_size
+        digests[file] = calculate_sha256(file)
+        print(f"  - {file.name} ({sizes[file] / 1024:.1f} KB)")
+        print(f"    SHA256: {digests[file]}")
         print()
     
     print("\nPyPI Upload Instructions:")
@@ -80,29 +137,16 @@ def main():
         response = input("Credentials detected. Would you like to upload now? (y/N): ")
         if response.lower() == 'y':
             print("Uploading to PyPI...")
-            try:
-                result = subprocess.run(
-                    ["twine", "upload", "dist/*"],
-                    check=True,
-                    capture_output=True,
-                    text=True
-                )
-                print("Upload successful!")
-                print(result.stdout)
-            except subprocess.CalledProcessError as e:
-                print(f"Upload failed: {e}")
-                print(f"stderr: {e.stderr}")
-                sys.exit(1)
+            upload_dist_files(dist_files, use_subprocess=args.subprocess)
     
     print("\nHomebrew Formula SHA256 Hash:")
     print("-" * 30)
-    tar_files = list(dist_dir.glob("*.tar.gz"))
     if tar_files:
         tar_file = tar_files[0]
-        sha256 = calculate_sha256(tar_file)
+        sha256 = digests[tar_file]
         print(f"Source distribution: {tar_file.name}")
         print(f"SHA256: {sha256}")
-        print(f"Size: {tar_file.stat().st_size} bytes")
+        print(f"Size: {sizes[tar_file]} bytes")
         print(f"\nUpdate Homebrew formula with:")
         print(f'  url "https://files.pythonhosted.org/packages/source/a/ai-trackdown-pytools/{tar_file.name}"')
         print(f'  sha256 "{sha256}"')
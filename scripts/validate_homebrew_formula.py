@@ -11,14 +11,29 @@ import sys
 from pathlib import Path
 from typing import List, Tuple
 
+_CLASS_RE = re.compile(r'class\s+(\w+)\s+<\s+Formula')
+_URL_RE = re.compile(r'url\s+"([^"]+)"')
+_HOMEPAGE_RE = re.compile(r'homepage\s+"([^"]+)"')
+_REQUIRED_FIELD_RES = (
+    ('desc', re.compile(r'desc\s+"([^"]+)"')),
+    ('homepage', _HOMEPAGE_RE),
+    ('url', _URL_RE),
+    ('sha256', re.compile(r'sha256\s+"([^"]+)"')),
+    ('license', re.compile(r'license\s+"([^"]+)"')),
+)
+_RESOURCE_RE = re.compile(r'resource\s+"([^"]+)"')
+_INDENT_ALLOWED_RE = re.compile(r'^\s*(desc|homepage|url|sha256|license|depends_on)')
+
 
 class FormulaValidator:
     """Validator for Homebrew formula files."""
     
-    def __init__(self, formula_path: str):
+    def __init__(self, formula_path: str) -> None:
         self.formula_path = Path(formula_path)
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.content = ""
+        self.lines: List[str] = []
         
     def validate(self) -> bool:
         """Run all validation checks."""
@@ -29,25 +44,27 @@ class FormulaValidator:
             self.errors.append(f"Formula file not found: {self.formula_path}")
             return False
             
-        content = self.formula_path.read_text()
+        # Read and split once; every check works from these
+        self.content = self.formula_path.read_text(encoding="utf-8")
+        self.lines = self.content.splitlines()
         
         # Run validation checks
-        self._validate_class_name(content)
-        self._validate_required_fields(content)
-        self._validate_urls(content)
-        self._validate_dependencies(content)
-        self._validate_install_method(content)
-        self._validate_test_block(content)
-        self._validate_syntax(content)
+        self._validate_class_name()
+        self._validate_required_fields()
+        self._validate_urls()
+        self._validate_dependencies()
+        self._validate_install_method()
+        self._validate_test_block()
+        self._validate_syntax()
         
         # Report results
         self._report_results()
         
         return len(self.errors) == 0
         
-    def _validate_class_name(self, content: str) -> None:
+    def _validate_class_name(self) -> None:
         """Validate the formula class name."""
-        class_match = re.search(r'class\s+(\w+)\s+<\s+Formula', content)
+        class_match = _CLASS_RE.search(self.content)
         if not class_match:
             self.errors.append("No Formula class found")
             return
@@ -58,26 +75,18 @@ class FormulaValidator:
         if class_name != expected_name:
             self.warnings.append(f"Class name '{class_name}' doesn't match expected '{expected_name}'")
             
-    def _validate_required_fields(self, content: str) -> None:
+    def _validate_required_fields(self) -> None:
         """Validate required formula fields."""
-        required_fields = [
-            ('desc', r'desc\s+"([^"]+)"'),
-            ('homepage', r'homepage\s+"([^"]+)"'),
-            ('url', r'url\s+"([^"]+)"'),
-            ('sha256', r'sha256\s+"([^"]+)"'),
-            ('license', r'license\s+"([^"]+)"'),
-        ]
-        
-        for field_name, pattern in required_fields:
-            if not re.search(pattern, content):
+        for field_name, pattern in _REQUIRED_FIELD_RES:
+            if not pattern.search(self.content):
                 self.errors.append(f"Missing required field: {field_name}")
-            elif field_name == "sha256" and "PLACEHOLDER_SHA256" in content:
+            elif field_name == "sha256" and "PLACEHOLDER_SHA256" in self.content:
                 self.warnings.append("SHA256 is still placeholder - update before publishing")
                 
-    def _validate_urls(self, content: str) -> None:
+    def _validate_urls(self) -> None:
         """Validate URLs in the formula."""
-        url_match = re.search(r'url\s+"([^"]+)"', content)
-        homepage_match = re.search(r'homepage\s+"([^"]+)"', content)
+        url_match = _URL_RE.search(self.content)
+        homepage_match = _HOMEPAGE_RE.search(self.content)
         
         if url_match:
             url = url_match.group(1)
@@ -89,9 +98,9 @@ class FormulaValidator:
             if not homepage.startswith("https://github.com/"):
                 self.warnings.append("Homepage should be a GitHub URL")
                 
-    def _validate_dependencies(self, content: str) -> None:
+    def _validate_dependencies(self) -> None:
         """Validate Python dependencies."""
-        if 'depends_on "python@3.11"' not in content:
+        if 'depends_on "python@3.11"' not in self.content:
             self.errors.append("Missing Python dependency")
             
         # Check for common Python dependencies
@@ -100,25 +109,26 @@ class FormulaValidator:
             "typer", "jinja2", "jsonschema", "toml", "pathspec"
         ]
         
+        present = set(_RESOURCE_RE.findall(self.content))
         for resource in expected_resources:
-            if f'resource "{resource}"' not in content:
+            if resource not in present:
                 self.warnings.append(f"Missing resource: {resource}")
                 
-    def _validate_install_method(self, content: str) -> None:
+    def _validate_install_method(self) -> None:
         """Validate install method."""
-        if "include Language::Python::Virtualenv" not in content:
+        if "include Language::Python::Virtualenv" not in self.content:
             self.errors.append("Missing Python virtualenv include")
             
-        if "virtualenv_install_with_resources" not in content:
+        if "virtualenv_install_with_resources" not in self.content:
             self.errors.append("Missing virtualenv_install_with_resources call")
             
         # Check for shell completions
-        if "generate_completions_from_executable" not in content:
+        if "generate_completions_from_executable" not in self.content:
             self.warnings.append("No shell completions configured")
             
-    def _validate_test_block(self, content: str) -> None:
+    def _validate_test_block(self) -> None:
         """Validate test block."""
-        if "test do" not in content:
+        if "test do" not in self.content:
             self.errors.append("Missing test block")
             return
             
@@ -130,21 +140,23 @@ class FormulaValidator:
         ]
         
         for test_cmd, description in test_checks:
-            if test_cmd not in content:
+            if test_cmd not in self.content:
                 self.warnings.append(f"Missing test for {description}")
                 
-    def _validate_syntax(self, content: str) -> None:
+    def _validate_syntax(self) -> None:
         """Validate Ruby syntax basics."""
         # Check for balanced quotes
-        double_quotes = content.count('"')
+        double_quotes = self.content.count('"')
         if double_quotes % 2 != 0:
             self.errors.append("Unbalanced double quotes")
             
-        # Check for balanced blocks - account for class, def, and do blocks
-        lines = content.split('\n')
-        stack = []
-        for i, line in enumerate(lines, 1):
+        # Check balanced blocks (class, def and do) and indentation in one pass
+        stack: List[int] = []
+        for i, line in enumerate(self.lines, 1):
             stripped = line.strip()
+            if not stripped:
+                continue
+
             if (stripped.endswith(' do') or 
                 stripped.startswith('def ') or 
                 (stripped.startswith('class ') and ' < ' in stripped)):
@@ -154,19 +166,15 @@ class FormulaValidator:
                     self.errors.append(f"Line {i}: 'end' without matching 'class', 'do' or 'def'")
                 else:
                     stack.pop()
-        
+
+            if i > 1 and not line.startswith('  ') and not line.startswith('#'):
+                # Allow class/def/end at root level
+                if (not stripped.startswith(('class', 'def', 'end', 'resource'))
+                        and not _INDENT_ALLOWED_RE.match(line)):
+                    self.warnings.append(f"Line {i}: Inconsistent indentation")
+
         if stack:
             self.errors.append(f"Unmatched 'class', 'do' or 'def' blocks at lines: {stack}")
-            
-        # Check indentation consistency
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            stripped = line.lstrip()
-            if stripped and not line.startswith('  ') and not line.startswith('#') and i > 1:
-                # Allow class/def/end at root level
-                if not any(stripped.startswith(keyword) for keyword in ['class', 'def', 'end', 'resource']):
-                    if not re.match(r'^\s*(desc|homepage|url|sha256|license|depends_on)', line):
-                        self.warnings.append(f"Line {i}: Inconsistent indentation")
                         
     def _report_results(self) -> None:
         """Report validation results."""
@@ -188,7 +196,7 @@ class FormulaValidator:
             print(f"\n❌ Formula validation failed with {len(self.errors)} errors and {len(self.warnings)} warnings")
 
 
-def main():
+def main() -> int:
     """Main function."""
     if len(sys.argv) != 2:
         print("Usage: python validate_homebrew_formula.py <formula_file>")
@@ -4,37 +4,89 @@
 This script performs comprehensive checks to ensure the package is ready for PyPI publication.
 """
 
+import re
 import subprocess
 import sys
 import os
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, distribution
 from pathlib import Path
+from types import SimpleNamespace
 import json
-import toml
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-def run_command(cmd, capture=True):
-    """Run a command and return result."""
-    if isinstance(cmd, str):
-        cmd = cmd.split()
-    
-    if capture:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
-    else:
-        return subprocess.run(cmd).returncode == 0, "", ""
+
+# ai_trackdown_pytools-1.0.0-py3-none-any.whl / ai_trackdown_pytools-1.0.0.tar.gz
+_DIST_RE = re.compile(r"^ai_trackdown_pytools-([^-]+)(?:-.*\.whl|\.tar\.gz)$")
+_VERSION_RE = re.compile(r'^\s*__version__\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+
+@lru_cache(maxsize=1)
+def _load_pyproject():
+    """Parse pyproject.toml once; every check shares the result."""
+    with open("pyproject.toml", "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=1)
+def _pyproject():
+    """Return the [project] fields the checks use, looked up once."""
+    project = _load_pyproject().get("project", {})
+    return SimpleNamespace(
+        project=project,
+        urls=project.get("urls", {}),
+        scripts=project.get("scripts", {}),
+        dependencies=project.get("dependencies", []),
+        optional_dependencies=project.get("optional-dependencies", {}),
+        requires_python=project.get("requires-python", ""),
+    )
+
+
+@lru_cache(maxsize=1)
+def _dist_files():
+    """List dist/ once for all checks; None when the directory is missing."""
+    try:
+        with os.scandir("dist") as entries:
+            return [
+                entry.name
+                for entry in entries
+                if entry.is_file() and not entry.name.startswith(".")
+            ]
+    except FileNotFoundError:
+        return None
+
+
+def _installed_version():
+    """Return the installed package version, or None if not usable.
+
+    Editable installs are skipped: their metadata is written at install time
+    and goes stale as soon as the version in the tree is bumped.
+    """
+    try:
+        dist = distribution("ai-trackdown-pytools")
+    except PackageNotFoundError:
+        return None
+    direct_url = dist.read_text("direct_url.json")
+    if direct_url and json.loads(direct_url).get("dir_info", {}).get("editable"):
+        return None
+    return dist.version
 
 
 def check_dist_files():
     """Check if distribution files exist."""
     print("\n📦 Checking distribution files...")
     
-    dist_dir = Path("dist")
-    if not dist_dir.exists():
+    dist_files = _dist_files()
+    if dist_files is None:
         print("  ❌ dist/ directory not found")
         return False
     
-    wheel_files = list(dist_dir.glob("*.whl"))
-    tar_files = list(dist_dir.glob("*.tar.gz"))
+    wheel_files = [name for name in dist_files if name.endswith(".whl")]
+    tar_files = [name for name in dist_files if name.endswith(".tar.gz")]
     
     if not wheel_files:
         print("  ❌ No wheel file found")
@@ -44,8 +96,8 @@ def check_dist_files():
         print("  ❌ No source distribution found")
         return False
     
-    print(f"  ✅ Wheel: {wheel_files[0].name}")
-    print(f"  ✅ Source: {tar_files[0].name}")
+    print(f"  ✅ Wheel: {wheel_files[0]}")
+    print(f"  ✅ Source: {tar_files[0]}")
     return True
 
 
@@ -54,45 +106,33 @@ def check_version_consistency():
     print("\n🔢 Checking version consistency...")
     
     # Read pyproject.toml version
-    with open("pyproject.toml", "r") as f:
-        data = toml.load(f)
-        pyproject_version = data["project"]["version"]
-    
-    # Read __init__.py for version
-    init_file = Path("src/ai_trackdown_pytools/__init__.py")
-    version_py = None
-    if init_file.exists():
-        with open(init_file, "r") as f:
-            for line in f:
-                if "__version__" in line and '"' in line and "=" in line:
-                    parts = line.split('"')
-                    if len(parts) >= 2:
-                        version_py = parts[1]
-                        break
+    pyproject_version = _pyproject().project["version"]
+    
+    # Prefer the installed package metadata; fall back to grepping __init__.py
+    version_source = "installed package"
+    version_py = _installed_version()
+    if version_py is None:
+        version_source = "__init__.py"
+        init_file = Path("src/ai_trackdown_pytools/__init__.py")
+        version_py = None
+        if init_file.exists():
+            match = _VERSION_RE.search(init_file.read_text(encoding="utf-8"))
+            if match:
+                version_py = match.group(1)
     
     print(f"  📄 pyproject.toml: {pyproject_version}")
     if version_py:
-        print(f"  📄 __init__.py: {version_py}")
+        print(f"  📄 {version_source}: {version_py}")
         if version_py != pyproject_version:
             print("  ❌ Version mismatch!")
             return False
     
     # Check dist file versions
     dist_versions = set()
-    dist_dir = Path("dist")
-    if dist_dir.exists():
-        for file in dist_dir.glob("ai_trackdown_pytools-*.whl"):
-            # Extract version from filename like ai_trackdown_pytools-1.0.0-py3-none-any.whl
-            parts = file.stem.split("-")  # stem removes .whl extension
-            if len(parts) >= 2:
-                dist_versions.add(parts[1])
-        
-        for file in dist_dir.glob("ai_trackdown_pytools-*.tar.gz"):
-            # Extract version from filename like ai_trackdown_pytools-1.0.0.tar.gz
-            name_without_ext = file.name.replace(".tar.gz", "")
-            parts = name_without_ext.split("-")
-            if len(parts) >= 2:
-                dist_versions.add(parts[1])
+    for name in _dist_files() or ():
+        match = _DIST_RE.match(name)
+        if match:
+            dist_versions.add(match.group(1))
     
     if dist_versions:
         dist_version = dist_versions.pop()
@@ -109,18 +149,30 @@ def check_twine_validation():
     """Run twine check on distribution files."""
     print("\n🔍 Running twine validation...")
     
-    success, stdout, stderr = run_command("twine check dist/*")
+    # No shell here, so expand dist/* ourselves rather than pass it literally
+    files = sorted(os.path.join("dist", name) for name in _dist_files() or ())
+    if not files:
+        print("  ❌ No distribution files to check")
+        return False
     
-    if success:
+    # Stream twine's report line by line as it checks each file
+    with subprocess.Popen(
+        ["twine", "check", *files],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    ) as proc:
+        for line in proc.stdout:
+            print(f"     {line.rstrip()}")
+    
+    if proc.returncode == 0:
         print("  ✅ Twine validation passed")
-        if stdout:
-            for line in stdout.strip().split("\n"):
-                print(f"     {line}")
         return True
     else:
         print("  ❌ Twine validation failed")
-        if stderr:
-            print(f"     Error: {stderr}")
         return False
 
 
@@ -137,9 +189,11 @@ def check_required_files():
         "MANIFEST.in"
     ]
     
+    # One directory listing instead of a stat per file
+    present = set(os.listdir("."))
     all_exist = True
     for file in required_files:
-        if Path(file).exists():
+        if file in present:
             print(f"  ✅ {file}")
         else:
             print(f"  ❌ {file} - MISSING")
@@ -152,9 +206,8 @@ def check_package_metadata():
     """Check package metadata completeness."""
     print("\n📝 Checking package metadata...")
     
-    with open("pyproject.toml", "r") as f:
-        data = toml.load(f)
-        project = data.get("project", {})
+    pyproject = _pyproject()
+    project = pyproject.project
     
     required_fields = [
         "name",
@@ -176,7 +229,7 @@ def check_package_metadata():
             all_present = False
     
     # Check URLs
-    urls = project.get("urls", {})
+    urls = pyproject.urls
     if urls:
         print("  ✅ Project URLs defined:")
         for key, url in urls.items():
@@ -191,9 +244,7 @@ def check_python_compatibility():
     """Check Python version compatibility."""
     print("\n🐍 Checking Python compatibility...")
     
-    with open("pyproject.toml", "r") as f:
-        data = toml.load(f)
-        requires_python = data["project"].get("requires-python", "")
+    requires_python = _pyproject().requires_python
     
     print(f"  📋 Requires Python: {requires_python}")
     
@@ -207,14 +258,13 @@ def check_dependencies():
     """Check if all dependencies are properly specified."""
     print("\n📚 Checking dependencies...")
     
-    with open("pyproject.toml", "r") as f:
-        data = toml.load(f)
-        deps = data["project"].get("dependencies", [])
+    pyproject = _pyproject()
+    deps = pyproject.dependencies
     
     print(f"  📦 {len(deps)} runtime dependencies")
     
     # Check for optional dependencies
-    optional = data["project"].get("optional-dependencies", {})
+    optional = pyproject.optional_dependencies
     if optional:
         print("  📦 Optional dependency groups:")
         for group, deps in optional.items():
@@ -227,9 +277,7 @@ def check_entry_points():
     """Check console script entry points."""
     print("\n🚀 Checking entry points...")
     
-    with open("pyproject.toml", "r") as f:
-        data = toml.load(f)
-        scripts = data["project"].get("scripts", {})
+    scripts = _pyproject().scripts
     
     if scripts:
         print(f"  ✅ {len(scripts)} console scripts defined:")
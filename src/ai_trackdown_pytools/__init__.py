@@ -1,7 +1,20 @@
 """AI Trackdown PyTools - Python CLI tools for AI project tracking and task management."""
 
+import importlib
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core.config import Config
+    from .core.project import Project
+    from .core.task import Task
+    from .version import (
+        Version,
+        format_version_info,
+        get_version,
+        get_version_info,
+    )
 
 
 # Read version from VERSION file
@@ -26,10 +39,17 @@ __version__ = _get_version()
 __author__ = "AI Trackdown Team"
 __email__ = "dev@ai-trackdown.com"
 
-from .core.config import Config
-from .core.project import Project
-from .core.task import Task
-from .version import get_version, get_version_info, format_version_info, Version
+# Public names resolved on first access, so importing a submodule such as
+# .version does not drag in the core modules and their dependencies
+_LAZY_ATTRS = {
+    "Config": ".core.config",
+    "Project": ".core.project",
+    "Task": ".core.task",
+    "get_version": ".version",
+    "get_version_info": ".version",
+    "format_version_info": ".version",
+    "Version": ".version",
+}
 
 __all__ = [
     "Config",
@@ -41,3 +61,13 @@ __all__ = [
     "format_version_info",
     "Version",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first attribute access (PEP 562)."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
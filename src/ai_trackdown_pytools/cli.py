@@ -1,43 +1,80 @@
 """Main CLI entry point for ai-trackdown-pytools."""
 
+import importlib
 import sys
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
 
+import click
 import typer
+from typer.core import TyperGroup
 
 # from rich.console import Console as RichConsole
 # from rich.panel import Panel
-from rich.traceback import install
 
 from . import __version__
-from .commands import (
-    ai,
-    bug,
-    comment,
-    create,
-    epic,
-    index,
-    init,
-    issue,
-    migrate,
-    portfolio,
-    pr,
-    search as search_cmd,
-    status,
-    sync,
-    task,
-    template,
-)
-from .commands import validate_typer as validate_cmd
 from .core.config import Config
 from .utils.logging import setup_logging
 from .utils.console import get_console, Console
 
-# Install rich traceback handler for better error display
-install(show_locals=False)
+# Subcommand groups as name -> (module in .commands, help). Modules are only
+# imported when their command is resolved, so e.g. --version stays cheap.
+SUBCOMMANDS = {
+    # Core functionality
+    "init": ("init", "Initialize project"),
+    "status": ("status", "Show status"),
+    "create": ("create", "Create tasks/issues"),
+    "template": ("template", "Manage templates"),
+    "validate": ("validate_typer", "Validate data"),
+    # Task management commands
+    "task": ("task", "Task operations"),
+    "issue": ("issue", "Issue tracking"),
+    "bug": ("bug", "Bug tracking"),
+    "epic": ("epic", "Epic management"),
+    "pr": ("pr", "Pull requests"),
+    "comment": ("comment", "Comments"),
+    # Advanced functionality
+    "search": ("search", "Search"),
+    "index": ("index", "Search index management"),
+    "portfolio": ("portfolio", "Portfolio mgmt"),
+    "sync": ("sync", "Sync platforms"),
+    "ai": ("ai", "AI commands"),
+    "migrate": ("migrate", "Migration"),
+}
+
+
+def _load_subcommand(name: str) -> click.Command:
+    """Import a subcommand module and build its click group."""
+    module_name, help_text = SUBCOMMANDS[name]
+    module = importlib.import_module(f".commands.{module_name}", __package__)
+    wrapper = typer.Typer(rich_markup_mode="rich")
+    wrapper.add_typer(module.app, name=name, help=help_text)
+    return typer.main.get_group(wrapper).commands[name]
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root group that resolves the SUBCOMMANDS groups on first use.
+
+    As with eager ``add_typer`` registration, a subcommand group takes
+    precedence over a top-level command of the same name.
+    """
+
+    def __init__(self, **attrs) -> None:
+        super().__init__(**attrs)
+        self._loaded_subcommands = set()
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)).union(SUBCOMMANDS))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in SUBCOMMANDS and cmd_name not in self._loaded_subcommands:
+            self.commands[cmd_name] = _load_subcommand(cmd_name)
+            self._loaded_subcommands.add(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 app = typer.Typer(
+    cls=LazyTyperGroup,
     name="aitrackdown",
     help="AI-powered project tracking and task management",
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -137,30 +174,6 @@ def main(
         Config.load(Path(config_file))
 
 
-# Add subcommands - Core functionality
-app.add_typer(init.app, name="init", help="Initialize project")
-app.add_typer(status.app, name="status", help="Show status")
-app.add_typer(create.app, name="create", help="Create tasks/issues")
-app.add_typer(template.app, name="template", help="Manage templates")
-app.add_typer(validate_cmd.app, name="validate", help="Validate data")
-
-# Add task management commands
-app.add_typer(task.app, name="task", help="Task operations")
-app.add_typer(issue.app, name="issue", help="Issue tracking")
-app.add_typer(bug.app, name="bug", help="Bug tracking")
-app.add_typer(epic.app, name="epic", help="Epic management")
-app.add_typer(pr.app, name="pr", help="Pull requests")
-app.add_typer(comment.app, name="comment", help="Comments")
-
-# Add advanced functionality
-app.add_typer(search_cmd.app, name="search", help="Search")
-app.add_typer(index.app, name="index", help="Search index management")
-app.add_typer(portfolio.app, name="portfolio", help="Portfolio mgmt")
-app.add_typer(sync.app, name="sync", help="Sync platforms")
-app.add_typer(ai.app, name="ai", help="AI commands")
-app.add_typer(migrate.app, name="migrate", help="Migration")
-
-
 @app.command()
 def info() -> None:
     """Show system information."""
@@ -435,11 +448,7 @@ def search(
     query_lower = query.lower()
 
     for task_item in all_tasks:
-        if (
-            query_lower in task_item.title.lower()
-            or query_lower in task_item.description.lower()
-            or any(query_lower in tag.lower() for tag in task_item.tags)
-        ):
+        if query_lower in task_item.search_text:
 
             # Apply filters
             if task_type:
@@ -450,10 +459,10 @@ def search(
             if status_filter and task_item.status != status_filter:
                 continue
 
+            if len(matching_tasks) >= limit:
+                break
             matching_tasks.append(task_item)
 
-    matching_tasks = matching_tasks[:limit]
-
     if not matching_tasks:
         console.print(f"[yellow]No tasks found matching '{query}'[/yellow]")
         return
@@ -1207,6 +1216,12 @@ def validate(
 
 def run_cli() -> None:
     """Main entry point with error handling."""
+    # Install rich traceback handler for better error display; done here
+    # rather than at import so importing the CLI has no side effects
+    from rich.traceback import install
+
+    install(show_locals=False)
+
     try:
         app()
     except KeyboardInterrupt:
@@ -1,23 +1,6 @@
 """Command modules for AI Trackdown PyTools CLI."""
 
-from ai_trackdown_pytools.commands import (
-    ai,
-    bug,
-    comment,
-    create,
-    epic,
-    init,
-    issue,
-    migrate,
-    portfolio,
-    pr,
-    search,
-    status,
-    sync,
-    task,
-    template,
-    validate,
-)
+import importlib
 
 __all__ = [
     "ai",
@@ -37,3 +20,12 @@ __all__ = [
     "template",
     "validate",
 ]
+
+
+def __getattr__(name):
+    """Import command modules on first attribute access (PEP 562)."""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,6 @@
 """Advanced search and filtering commands."""
 
+import heapq
 from pathlib import Path
 from typing import List, Optional
 import re
@@ -81,6 +82,13 @@ def tasks(
     # Define search fields
     search_fields = field or ["title", "description", "tags"]
 
+    # The default fields are lower-cased once per task via Task.search_text
+    use_search_text = (
+        not regex
+        and not case_sensitive
+        and set(search_fields) == {"title", "description", "tags"}
+    )
+
     # Filter and search tasks
     matching_tasks = []
 
@@ -144,6 +152,11 @@ def tasks(
                 )
                 raise typer.Exit(1)
 
+        if use_search_text:
+            if query_lower in task.search_text:
+                matching_tasks.append(task)
+            continue
+
         # Perform search
         match_found = False
 
@@ -187,11 +200,13 @@ def tasks(
         ),
     }
 
+    # Select the top `limit` results without sorting every match;
+    # nsmallest/nlargest equal sorted(...)[:limit], ties included
     if sort_by in sort_key_map:
-        matching_tasks.sort(key=sort_key_map[sort_by], reverse=reverse)
-
-    # Limit results
-    matching_tasks = matching_tasks[:limit]
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        matching_tasks = select(limit, matching_tasks, key=sort_key_map[sort_by])
+    else:
+        matching_tasks = matching_tasks[:limit]
 
     if not matching_tasks:
         console.print(f"[yellow]No tasks found matching '{query}'[/yellow]")
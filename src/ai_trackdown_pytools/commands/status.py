@@ -1,5 +1,6 @@
 """Show project and task status."""
 
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
@@ -69,6 +70,7 @@ def project(
         for t in tasks
         if not any(tag in t.tags for tag in ["epic", "issue", "pull-request"])
     ]
+    status_counts = Counter(t.status for t in tasks)
 
     task_stats = {
         "total": len(tasks),
@@ -76,10 +78,10 @@ def project(
         "issues": len(issues),
         "prs": len(prs),
         "tasks": len(regular_tasks),
-        TicketStatus.OPEN.value: len([t for t in tasks if t.status == TicketStatus.OPEN.value]),
-        TicketStatus.IN_PROGRESS.value: len([t for t in tasks if t.status == TicketStatus.IN_PROGRESS.value]),
-        TicketStatus.COMPLETED.value: len([t for t in tasks if t.status == TicketStatus.COMPLETED.value]),
-        "blocked": len([t for t in tasks if t.status == "blocked"]),
+        TicketStatus.OPEN.value: status_counts[TicketStatus.OPEN.value],
+        TicketStatus.IN_PROGRESS.value: status_counts[TicketStatus.IN_PROGRESS.value],
+        TicketStatus.COMPLETED.value: status_counts[TicketStatus.COMPLETED.value],
+        "blocked": status_counts["blocked"],
     }
 
     # Type breakdown
@@ -1,8 +1,9 @@
 """Sync commands for GitHub and other platforms."""
 
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
 import json
+import os
 from datetime import datetime
 
 import typer
@@ -12,7 +13,7 @@ from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 from ai_trackdown_pytools.core.project import Project
-from ai_trackdown_pytools.core.task import TaskManager
+from ai_trackdown_pytools.core.task import Task, TaskManager
 from ai_trackdown_pytools.utils.git import GitUtils
 from ai_trackdown_pytools.utils.github import GitHubCLI, GitHubError
 
@@ -56,14 +57,22 @@ def github(
         # Try to extract from git remote
         try:
             remote_url = git_utils.get_remote_url()
-            if remote_url and "github.com" in remote_url:
+            cached_remote = sync_config.get("_cached_remote", {})
+            if remote_url and cached_remote.get("url") == remote_url:
+                repo = cached_remote["owner_repo"]
+            elif remote_url and "github.com" in remote_url:
                 # Parse GitHub URL
-                if remote_url.endswith(".git"):
-                    remote_url = remote_url[:-4]
-                if "github.com/" in remote_url:
-                    repo = remote_url.split("github.com/")[-1]
+                url = remote_url[:-4] if remote_url.endswith(".git") else remote_url
+                if "github.com/" in url:
+                    repo = url.split("github.com/")[-1]
                     if repo.startswith("git@"):
                         repo = repo.split(":")[-1]
+
+                    # Persisted with the sync metadata by push/pull only
+                    sync_config["_cached_remote"] = {
+                        "url": remote_url,
+                        "owner_repo": repo,
+                    }
         except Exception:
             pass
 
@@ -97,8 +106,8 @@ def github(
 [dim]Token configured:[/dim] {gh_auth_status}
 
 [dim]Local counts:[/dim]
-• Issues: {len([t for t in task_manager.list_tasks() if 'issue' in t.tags])}
-• PRs: {len([t for t in task_manager.list_tasks() if 'pull-request' in t.tags])}""",
+• Issues: {len(task_manager.tasks_with_tag('issue'))}
+• PRs: {len(task_manager.tasks_with_tag('pull-request'))}""",
                 title="Sync Status",
                 border_style="blue",
             )
@@ -109,7 +118,7 @@ def github(
         console.print(f"[blue]Pulling from GitHub repository: {repo}[/blue]")
 
         try:
-            gh = GitHubCLI(repo)
+            gh = GitHubCLI(repo, cache_dir=sync_config_file.parent / "github_cache")
 
             if dry_run:
                 console.print(
@@ -127,9 +136,10 @@ def github(
                 console.print(f"\nWould pull {len(issues)} issues and {len(prs)} PRs")
             else:
                 # Pull issues
-                created_issues, updated_issues = gh.pull_issues_from_github(
-                    task_manager, dry_run=False
-                )
+                with task_manager.deferred_counter_save():
+                    created_issues, updated_issues = gh.pull_issues_from_github(
+                        task_manager, dry_run=False
+                    )
 
                 # TODO: Pull PRs (similar to issues but with PR-specific logic)
                 created_prs = 0
@@ -158,9 +168,8 @@ def github(
             gh = GitHubCLI(repo)
 
             # Find unsynced items
-            all_tasks = task_manager.list_tasks()
-            issues = [t for t in all_tasks if "issue" in t.tags]
-            prs = [t for t in all_tasks if "pull-request" in t.tags]
+            issues = task_manager.tasks_with_tag("issue")
+            prs = task_manager.tasks_with_tag("pull-request")
 
             unsynced_issues = [i for i in issues if not i.metadata.get("github_id")]
             unsynced_prs = [p for p in prs if not p.metadata.get("github_id")]
@@ -413,84 +422,87 @@ def import_data(
         raise typer.Exit(1)
 
     task_manager = TaskManager(project_path)
+    item_count = 0
     imported_count = 0
 
-    if source == "github-json":
-        # Import from GitHub issues/PRs JSON export
-        with open(import_file, "r") as f:
-            github_data = json.load(f)
-
-        if not isinstance(github_data, list):
-            github_data = [github_data]
-
-        for item in github_data:
-            title = item.get("title", "Untitled")
-            description = item.get("body", "")
-            labels = [label.get("name", "") for label in item.get("labels", [])]
-
-            # Determine type
-            if "pull_request" in item:
-                item_type = "pull-request"
-                tags = ["pull-request"] + labels
-            else:
-                item_type = "issue"
-                tags = ["issue"] + labels
-
-            task_data = {
-                "title": title,
-                "description": description,
-                "tags": tags,
-                "metadata": {
-                    "github_id": item.get("id"),
-                    "github_number": item.get("number"),
-                    "github_url": item.get("html_url"),
-                    "imported_from": "github",
-                },
-            }
-
-            if dry_run:
-                console.print(f"Would import: {title} ({item_type})")
-            else:
-                task_manager.create_task(**task_data)
-                imported_count += 1
-
-    elif source == "csv":
-        # Import from CSV file
-        import csv
-
-        with open(import_file, "r") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                title = row.get("title", row.get("Title", "Untitled"))
-                description = row.get("description", row.get("Description", ""))
-                status = row.get("status", row.get("Status", "open"))
-                priority = row.get("priority", row.get("Priority", "medium"))
+    # Write the ID counters once for the whole import rather than per task
+    with task_manager.deferred_counter_save():
+        if source == "github-json":
+            # Import from GitHub issues/PRs JSON export
+            with open(import_file, "r") as f:
+                github_data = json.load(f)
+
+            if not isinstance(github_data, list):
+                github_data = [github_data]
+
+            for item in github_data:
+                item_count += 1
+                title = item.get("title", "Untitled")
+                description = item.get("body", "")
+                labels = [label.get("name", "") for label in item.get("labels", [])]
+
+                # Determine type
+                if "pull_request" in item:
+                    item_type = "pull-request"
+                    tags = ["pull-request"] + labels
+                else:
+                    item_type = "issue"
+                    tags = ["issue"] + labels
 
                 task_data = {
                     "title": title,
                     "description": description,
-                    "status": status,
-                    "priority": priority,
-                    "tags": [task_type],
-                    "metadata": {"imported_from": "csv", "original_data": row},
+                    "tags": tags,
+                    "metadata": {
+                        "github_id": item.get("id"),
+                        "github_number": item.get("number"),
+                        "github_url": item.get("html_url"),
+                        "imported_from": "github",
+                    },
                 }
 
                 if dry_run:
-                    console.print(f"Would import: {title} ({task_type})")
+                    console.print(f"Would import: {title} ({item_type})")
                 else:
                     task_manager.create_task(**task_data)
                     imported_count += 1
 
-    else:
-        console.print(f"[red]Unsupported import source: {source}[/red]")
-        console.print("Supported sources: github-json, csv")
-        raise typer.Exit(1)
+        elif source == "csv":
+            # Import from CSV file
+            import csv
+
+            with open(import_file, "r") as f:
+                reader = csv.DictReader(f)
+
+                for row in reader:
+                    item_count += 1
+                    title = row.get("title", row.get("Title", "Untitled"))
+                    description = row.get("description", row.get("Description", ""))
+                    status = row.get("status", row.get("Status", "open"))
+                    priority = row.get("priority", row.get("Priority", "medium"))
+
+                    task_data = {
+                        "title": title,
+                        "description": description,
+                        "status": status,
+                        "priority": priority,
+                        "tags": [task_type],
+                        "metadata": {"imported_from": "csv", "original_data": row},
+                    }
+
+                    if dry_run:
+                        console.print(f"Would import: {title} ({task_type})")
+                    else:
+                        task_manager.create_task(**task_data)
+                        imported_count += 1
+
+        else:
+            console.print(f"[red]Unsupported import source: {source}[/red]")
+            console.print("Supported sources: github-json, csv")
+            raise typer.Exit(1)
 
     if dry_run:
-        console.print(
-            f"[yellow]DRY RUN: Would import {len(github_data if source == 'github-json' else list(csv.DictReader(open(import_file))))} items[/yellow]"
-        )
+        console.print(f"[yellow]DRY RUN: Would import {item_count} items[/yellow]")
     else:
         console.print(f"[green]Successfully imported {imported_count} items[/green]")
 
@@ -515,34 +527,41 @@ def export(
         console.print("[red]No AI Trackdown project found[/red]")
         raise typer.Exit(1)
 
-    task_manager = TaskManager(project_path)
-    all_tasks = task_manager.list_tasks()
-
-    # Apply filters
-    filtered_tasks = all_tasks
-
-    if task_type:
-        filtered_tasks = [t for t in filtered_tasks if task_type in t.tags]
-
-    if status_filter:
-        filtered_tasks = [t for t in filtered_tasks if t.status == status_filter]
-
-    # Generate output filename if not provided
-    if not output:
-        timestamp = (
-            filtered_tasks[0].updated_at.strftime("%Y%m%d_%H%M%S")
-            if filtered_tasks
-            else "empty"
-        )
-        output = f"export_{timestamp}.{format.split('-')[0]}"
+    if format not in ("json", "csv", "github-json"):
+        console.print(f"[red]Unsupported export format: {format}[/red]")
+        console.print("Supported formats: json, csv, github-json")
+        raise typer.Exit(1)
 
-    output_path = project_path / output
+    task_manager = TaskManager(project_path)
+    exported_count = 0
+    newest_task = None
+
+    def tracked(tasks: Iterable[Task]) -> Iterator[Task]:
+        """Pass tasks through, counting them and remembering the newest."""
+        nonlocal exported_count, newest_task
+        for task in tasks:
+            exported_count += 1
+            if newest_task is None or task.created_at > newest_task.created_at:
+                newest_task = task
+            yield task
+
+    # Tasks are streamed straight from disk, so memory stays flat however
+    # large the project is. The default file name depends on the newest
+    # task, which is only known once every task has been seen, so write to
+    # a temporary name and rename at the end.
+    filtered_tasks = tracked(
+        task_manager.iter_tasks(status=status_filter, tag=task_type)
+    )
+    write_path = (
+        project_path / output
+        if output
+        else project_path / f".export_{os.getpid()}.tmp"
+    )
 
-    if format == "json":
-        # Export as JSON
-        export_data = []
-        for task in filtered_tasks:
-            export_data.append(
+    try:
+        if format == "json":
+            # Export as JSON
+            export_data = (
                 {
                     "id": task.id,
                     "title": task.title,
@@ -555,51 +574,50 @@ def export(
                     "updated_at": task.updated_at.isoformat(),
                     "metadata": task.metadata,
                 }
+                for task in filtered_tasks
             )
 
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2)
-
-    elif format == "csv":
-        # Export as CSV
-        import csv
-
-        with open(output_path, "w", newline="") as f:
-            fieldnames = [
-                "id",
-                "title",
-                "description",
-                "status",
-                "priority",
-                "tags",
-                "assignees",
-                "created_at",
-                "updated_at",
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for task in filtered_tasks:
-                writer.writerow(
-                    {
-                        "id": task.id,
-                        "title": task.title,
-                        "description": task.description,
-                        "status": task.status,
-                        "priority": task.priority,
-                        "tags": ", ".join(task.tags),
-                        "assignees": ", ".join(task.assignees),
-                        "created_at": task.created_at.isoformat(),
-                        "updated_at": task.updated_at.isoformat(),
-                    }
-                )
+            with open(write_path, "w") as f:
+                _write_json_array(export_data, f)
+
+        elif format == "csv":
+            # Export as CSV
+            import csv
+
+            with open(write_path, "w", newline="") as f:
+                fieldnames = [
+                    "id",
+                    "title",
+                    "description",
+                    "status",
+                    "priority",
+                    "tags",
+                    "assignees",
+                    "created_at",
+                    "updated_at",
+                ]
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+
+                writer.writeheader()
+                for task in filtered_tasks:
+                    writer.writerow(
+                        {
+                            "id": task.id,
+                            "title": task.title,
+                            "description": task.description,
+                            "status": task.status,
+                            "priority": task.priority,
+                            "tags": ", ".join(task.tags),
+                            "assignees": ", ".join(task.assignees),
+                            "created_at": task.created_at.isoformat(),
+                            "updated_at": task.updated_at.isoformat(),
+                        }
+                    )
 
-    elif format == "github-json":
-        # Export in GitHub issues format
-        export_data = []
-        for task in filtered_tasks:
-            if "issue" in task.tags:
-                github_issue = {
+        elif format == "github-json":
+            # Export in GitHub issues format
+            export_data = (
+                {
                     "title": task.title,
                     "body": task.description,
                     "state": (
@@ -607,20 +625,47 @@ def export(
                     ),
                     "labels": [{"name": tag} for tag in task.tags if tag != "issue"],
                 }
-                export_data.append(github_issue)
+                for task in filtered_tasks
+                if "issue" in task.tags_set
+            )
 
-        with open(output_path, "w") as f:
-            json.dump(export_data, f, indent=2)
+            with open(write_path, "w") as f:
+                _write_json_array(export_data, f)
+    except BaseException:
+        # Don't leave a half-written temporary file in the project root
+        if not output:
+            write_path.unlink(missing_ok=True)
+        raise
 
+    if output:
+        output_path = write_path
     else:
-        console.print(f"[red]Unsupported export format: {format}[/red]")
-        console.print("Supported formats: json, csv, github-json")
-        raise typer.Exit(1)
+        timestamp = (
+            newest_task.updated_at.strftime("%Y%m%d_%H%M%S")
+            if newest_task
+            else "empty"
+        )
+        output_path = project_path / f"export_{timestamp}.{format.split('-')[0]}"
+        os.replace(write_path, output_path)
 
     console.print(
-        f"[green]Exported {len(filtered_tasks)} tasks to {output_path}[/green]"
+        f"[green]Exported {exported_count} tasks to {output_path}[/green]"
     )
 
 
+def _write_json_array(records: Iterable[Dict[str, Any]], f: TextIO) -> None:
+    """Write records as a JSON array one at a time.
+
+    Produces the same layout as ``json.dump(list(records), f, indent=2)``
+    without building the list first.
+    """
+    separator = "[\n  "
+    for record in records:
+        # JSON strings never contain raw newlines, so re-indenting is safe
+        f.write(separator + json.dumps(record, indent=2).replace("\n", "\n  "))
+        separator = ",\n  "
+    f.write("[]" if separator == "[\n  " else "\n]")
+
+
 if __name__ == "__main__":
     app()
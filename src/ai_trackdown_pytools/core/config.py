@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, ConfigDict
@@ -29,6 +29,9 @@ class Config:
     _config: ConfigModel
     _config_path: Optional[Path] = None
     _loaded_at: Optional[float] = None
+    # (st_mtime_ns, st_size) of the file as last read or written by us
+    _file_signature: Optional[Tuple[int, int]] = None
+    _force_reload: bool = False
 
     def __new__(cls, project_path: Optional[Path] = None) -> "Config":
         """Project-specific configuration instances."""
@@ -49,6 +52,8 @@ class Config:
             instance._config = ConfigModel()
             instance._config_path = None
             instance._loaded_at = None
+            instance._file_signature = None
+            instance._force_reload = False
             cls._instances[project_path] = instance
 
         return cls._instances[project_path]
@@ -57,7 +62,13 @@ class Config:
     def load(
         cls, config_path: Optional[Path] = None, project_path: Optional[Path] = None
     ) -> "Config":
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        Instances are shared per project, so while the file is unchanged on
+        disk since this instance last read or wrote it, the instance is
+        returned as is, including any set() not yet saved. A file changed
+        by someone else is re-read, discarding such unsaved values.
+        """
         instance = cls(project_path)
 
         if config_path is None:
@@ -65,12 +76,23 @@ class Config:
             config_path = cls.find_config_file()
 
         if config_path and config_path.exists():
+            st = config_path.stat()
+            signature = (st.st_mtime_ns, st.st_size)
+            if (
+                not instance._force_reload
+                and config_path == instance._config_path
+                and signature == instance._file_signature
+            ):
+                return instance
+
             with open(config_path, "r", encoding="utf-8") as f:
                 config_data = yaml.safe_load(f) or {}
 
             instance._config = ConfigModel(**config_data)
             instance._config_path = config_path
-            instance._loaded_at = config_path.stat().st_mtime
+            instance._loaded_at = st.st_mtime
+            instance._file_signature = signature
+            instance._force_reload = False
 
         return instance
 
@@ -113,7 +135,9 @@ class Config:
 
         instance._config = ConfigModel(**default_config)
         instance._config_path = config_path
-        instance._loaded_at = config_path.stat().st_mtime
+        st = config_path.stat()
+        instance._loaded_at = st.st_mtime
+        instance._file_signature = (st.st_mtime_ns, st.st_size)
 
         return instance
 
@@ -180,6 +204,10 @@ class Config:
                     sort_keys=False,
                 )
 
+            # The file now matches memory, so the next load() needn't re-read it
+            st = self._config_path.stat()
+            self._file_signature = (st.st_mtime_ns, st.st_size)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
         return self._config.model_dump()
@@ -230,6 +258,12 @@ class Config:
         # Load and return a fresh instance
         return cls.load(config_path=config_path, project_path=project_path)
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """Force the next load() of every cached instance to re-read its file."""
+        for instance in cls._instances.values():
+            instance._force_reload = True
+
     @classmethod
     def clear_cache(cls) -> None:
         """Clear all cached configuration instances."""
@@ -1,12 +1,23 @@
 """Task management for AI Trackdown PyTools."""
 
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, TextIO, Tuple
 
 import yaml
-from pydantic import BaseModel, ConfigDict, field_serializer
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    ValidationError,
+    field_serializer,
+    field_validator,
+)
 
 from ai_trackdown_pytools.core.config import Config
 from ai_trackdown_pytools.core.constants import (
@@ -24,6 +35,52 @@ from ai_trackdown_pytools.core.constants import (
 from ai_trackdown_pytools.core.exceptions import TaskError
 from ai_trackdown_pytools.utils.index import update_index_on_file_change
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as _SafeLoader
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+
+# Below this many task files, thread pool startup costs more than it saves
+_PARALLEL_LOAD_THRESHOLD = 16
+
+# Frontmatter sits at the top of the file; the markdown body is never parsed
+_FRONTMATTER_HEAD_SIZE = 16384
+
+
+def _read_frontmatter_head(f: TextIO) -> str:
+    """Read the head of a task file, or all of it if the frontmatter is longer."""
+    content = f.read(_FRONTMATTER_HEAD_SIZE)
+    if len(content) == _FRONTMATTER_HEAD_SIZE and not _FRONTMATTER_RE.match(content):
+        content += f.read()
+    return content
+
+
+def _load_frontmatter(text: str) -> Any:
+    """Parse a frontmatter block written as JSON, or as YAML by older versions."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return yaml.load(text, Loader=_SafeLoader)
+
+
+def _validate_json_frontmatter(content: str) -> Optional["TaskModel"]:
+    """Build a TaskModel straight from a JSON frontmatter block.
+
+    pydantic-core parses and validates the JSON in one pass, skipping the
+    intermediate dict. Returns None for YAML blocks or anything that fails,
+    leaving those to the generic extract-then-validate path.
+    """
+    match = _FRONTMATTER_RE.match(content)
+    if not match or not match.group(1).lstrip().startswith("{"):
+        return None
+    try:
+        return TaskModel.model_validate_json(match.group(1))
+    except ValidationError:
+        return None
+
+
 # from ai_trackdown_pytools.core.models import TaskModel as NewTaskModel, get_model_for_type
 # from ai_trackdown_pytools.utils.validation import SchemaValidator, ValidationResult
 
@@ -52,6 +109,24 @@ class TaskModel(BaseModel):
 
     model_config = ConfigDict()
 
+    @field_validator("created_at", "updated_at", "due_date", mode="wrap")
+    @classmethod
+    def parse_datetime(cls, value: Any, handler: Any) -> Any:
+        """Parse timestamps natively, falling back to datetime.fromisoformat.
+
+        Task files may hold compact forms such as ``20240101T120000``, which
+        pydantic rejects, or ``20240101``, which it would read as a Unix
+        timestamp rather than a date.
+        """
+        if isinstance(value, str) and value.isdigit():
+            return datetime.fromisoformat(value)
+        try:
+            return handler(value)
+        except ValidationError:
+            if not isinstance(value, str):
+                raise
+            return datetime.fromisoformat(value)
+
     @field_serializer("created_at", "updated_at", "due_date")
     def serialize_datetime(self, value: Optional[datetime]) -> Optional[str]:
         """Serialize datetime to ISO format."""
@@ -128,6 +203,24 @@ class Task:
     def dependencies(self) -> List[str]:
         return self.data.dependencies
 
+    @cached_property
+    def tags_set(self) -> FrozenSet[str]:
+        """Tags as a frozenset for membership tests; reset by update()."""
+        return frozenset(self.data.tags)
+
+    @property
+    def search_text(self) -> str:
+        """Lower-cased title, description and tags joined for substring search.
+
+        Fields are separated by a unit separator so a query cannot match
+        across field boundaries; tags are space-joined as one field, as
+        ``search tasks`` has always searched them.
+        """
+        data = self.data
+        return "\x1f".join(
+            [data.title, data.description, " ".join(data.tags)]
+        ).lower()
+
     @property
     def metadata(self) -> Dict[str, Any]:
         return self.data.metadata
@@ -143,30 +236,17 @@ class Task:
         """Load task from file."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                content = _read_frontmatter_head(f)
+
+            task_data = _validate_json_frontmatter(content)
+            if task_data is not None:
+                return cls(task_data, file_path)
 
             # Extract frontmatter
             frontmatter = cls._extract_frontmatter(content)
             if not frontmatter:
                 raise TaskError(f"Failed to parse task file: {file_path}")
 
-            # Convert datetime strings back to datetime objects if needed
-            if "created_at" in frontmatter:
-                if isinstance(frontmatter["created_at"], str):
-                    frontmatter["created_at"] = datetime.fromisoformat(
-                        frontmatter["created_at"]
-                    )
-            if "updated_at" in frontmatter:
-                if isinstance(frontmatter["updated_at"], str):
-                    frontmatter["updated_at"] = datetime.fromisoformat(
-                        frontmatter["updated_at"]
-                    )
-            if "due_date" in frontmatter and frontmatter["due_date"]:
-                if isinstance(frontmatter["due_date"], str):
-                    frontmatter["due_date"] = datetime.fromisoformat(
-                        frontmatter["due_date"]
-                    )
-
             task_data = TaskModel(**frontmatter)
             return cls(task_data, file_path)
 
@@ -176,17 +256,13 @@ class Task:
     @staticmethod
     def _extract_frontmatter(content: str) -> Optional[Dict[str, Any]]:
         """Extract YAML frontmatter from markdown content."""
-        import re
-
-        # Match frontmatter pattern
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
 
         if not match:
             return None
 
         try:
-            return yaml.safe_load(match.group(1))
+            return _load_frontmatter(match.group(1))
         except yaml.YAMLError:
             return None
 
@@ -201,6 +277,7 @@ class Task:
             if hasattr(self.data, key):
                 setattr(self.data, key, value)
 
+        self.__dict__.pop("tags_set", None)
         self.data.updated_at = datetime.now()
 
     def to_dict(self) -> Dict[str, Any]:
@@ -220,6 +297,20 @@ class TaskManager:
         # Ensure tasks directory exists
         self.tasks_dir.mkdir(exist_ok=True)
 
+        # Task ID -> file path, built lazily by _find_task_file
+        self._id_index: Optional[Dict[str, Path]] = None
+
+        # File path -> ((st_mtime_ns, st_size), parsed model) for _load_task_file
+        self._parse_cache: Dict[str, Tuple[Tuple[int, int], Optional[TaskModel]]] = {}
+
+        # Tag/status -> tasks (newest first), built lazily by _build_views
+        self._by_tag: Optional[Dict[str, List[Task]]] = None
+        self._by_status: Optional[Dict[str, List[Task]]] = None
+
+        # Set inside deferred_counter_save(); ID counters are then saved on exit
+        self._defer_counter_save = False
+        self._counter_dirty = False
+
     def create_task(self, **kwargs) -> Task:
         """Create a new task."""
         now = datetime.now()
@@ -261,11 +352,11 @@ class TaskManager:
 
     def load_task(self, task_id: str) -> Task:
         """Load task by ID."""
-        task_file = self._find_task_file(task_id)
+        task_file, st = self._stat_task_file(task_id)
         if not task_file:
             raise TaskError(f"Task not found: {task_id}")
 
-        task_data = self._load_task_file(task_file)
+        task_data = self._load_task_file(task_file, st)
         if not task_data:
             raise TaskError(f"Failed to parse task file: {task_file}")
 
@@ -275,23 +366,81 @@ class TaskManager:
         self, status: Optional[str] = None, tag: Optional[str] = None
     ) -> List[Task]:
         """List all tasks with optional filtering."""
-        tasks = []
-
-        for task_file in self.tasks_dir.rglob("*.md"):
-            task_data = self._load_task_file(task_file)
-            if task_data:
-                # Apply filters
-                if status and task_data.status != status:
-                    continue
-                if tag and tag not in task_data.tags:
-                    continue
-
-                tasks.append(Task(task_data, task_file))
+        entries = []
+        for entry in self._scan_task_files():
+            try:
+                entries.append((entry.path, entry.stat()))
+            except OSError:
+                continue
+
+        # File reads release the GIL, so overlap them for larger projects
+        if len(entries) < _PARALLEL_LOAD_THRESHOLD:
+            loaded = [self._load_task_file(path, st) for path, st in entries]
+        else:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(
+                    executor.map(lambda e: self._load_task_file(*e), entries)
+                )
+
+        tasks = [
+            Task(task_data, Path(path))
+            for (path, _), task_data in zip(entries, loaded)
+            if task_data and self._matches_filters(task_data, status, tag)
+        ]
 
         # Sort by creation date (newest first)
         tasks.sort(key=lambda t: t.created_at, reverse=True)
         return tasks
 
+    def iter_tasks(
+        self, status: Optional[str] = None, tag: Optional[str] = None
+    ) -> Iterator[Task]:
+        """Yield tasks with optional filtering, ordered by file name (task ID).
+
+        Files are parsed without going through the parse cache, so only the
+        task being yielded is held in memory.
+        """
+        entries = sorted(self._scan_task_files(), key=lambda e: (e.name, e.path))
+        for entry in entries:
+            task_data = self._parse_task_file(Path(entry.path))
+            if task_data and self._matches_filters(task_data, status, tag):
+                yield Task(task_data, Path(entry.path))
+
+    @staticmethod
+    def _matches_filters(
+        task_data: TaskModel, status: Optional[str], tag: Optional[str]
+    ) -> bool:
+        """Check task data against the optional list filters."""
+        if status and task_data.status != status:
+            return False
+        if tag and tag not in task_data.tags:
+            return False
+        return True
+
+    def tasks_with_tag(self, tag: str) -> List[Task]:
+        """Get tasks carrying a tag, newest first."""
+        if self._by_tag is None:
+            self._build_views()
+        return list(self._by_tag.get(tag, ()))
+
+    def tasks_with_status(self, status: str) -> List[Task]:
+        """Get tasks in a status, newest first."""
+        if self._by_status is None:
+            self._build_views()
+        return list(self._by_status.get(status, ()))
+
+    def _build_views(self) -> None:
+        """Index all tasks by tag and by status in one pass."""
+        by_tag: Dict[str, List[Task]] = {}
+        by_status: Dict[str, List[Task]] = {}
+        for task in self.list_tasks():
+            for tag in task.tags_set:
+                by_tag.setdefault(tag, []).append(task)
+            by_status.setdefault(task.status, []).append(task)
+        self._by_tag = by_tag
+        self._by_status = by_status
+
     def get_recent_tasks(self, limit: int = 5) -> List[Task]:
         """Get recently updated tasks."""
         tasks = self.list_tasks()
@@ -319,6 +468,10 @@ class TaskManager:
             return False
 
         task_file.unlink()
+        self._parse_cache.pop(str(task_file), None)
+        self._by_tag = self._by_status = None
+        if self._id_index is not None:
+            self._id_index.pop(task_id, None)
         return True
 
     def save_task(self, task: Task) -> None:
@@ -351,18 +504,48 @@ class TaskManager:
         # Ensure ID is unique
         while True:
             task_id = f"{prefix}-{counter:04d}"
-            if not self._find_task_file(task_id):
+            if not self._find_task_file(task_id, rescan=False):
                 break
             counter += 1
 
         # Update counter in config
         self.config.set(counter_key, counter + 1)
-        self.config.save()
+        if self._defer_counter_save:
+            self._counter_dirty = True
+        else:
+            self.config.save()
 
         return task_id
 
+    @contextmanager
+    def deferred_counter_save(self) -> Iterator[None]:
+        """Save ID counter updates once on exit instead of after every create.
+
+        Counters advance in memory as usual, so IDs stay sequential. If the
+        process dies first, the unsaved counter only lags; the next run skips
+        IDs whose files already exist.
+        """
+        if self._defer_counter_save:
+            yield
+            return
+
+        self._defer_counter_save = True
+        try:
+            yield
+        finally:
+            self._defer_counter_save = False
+            if self._counter_dirty:
+                self._counter_dirty = False
+                self.config.save()
+
     def _get_task_file_path(self, task_id: str, title: Optional[str] = None) -> Path:
         """Get task file path for task ID."""
+        task_file = self._default_task_file_path(task_id)
+        task_file.parent.mkdir(exist_ok=True)
+        return task_file
+
+    def _default_task_file_path(self, task_id: str) -> Path:
+        """Get the path a task file for task ID is created at."""
         # Determine directory based on prefix
         prefix = task_id.split("-")[0] if "-" in task_id else None
 
@@ -373,47 +556,115 @@ class TaskManager:
                 subdir_name = ticket_subdir
                 break
 
-        subdir = self.tasks_dir / subdir_name.value
-        subdir.mkdir(exist_ok=True)
-
         # Use just the ID for the filename to avoid issues with special characters
-        return subdir / f"{task_id}.md"
-
-    def _find_task_file(self, task_id: str) -> Optional[Path]:
+        return self.tasks_dir / subdir_name.value / f"{task_id}.md"
+
+    def _build_id_index(self) -> Dict[str, Path]:
+        """Map task IDs to files with a single walk of the tasks directory."""
+        index: Dict[str, Path] = {}
+        for entry in self._scan_task_files():
+            index.setdefault(entry.name[:-3], Path(entry.path))
+        return index
+
+    def _scan_task_files(self) -> Iterator[os.DirEntry]:
+        """Yield a directory entry for every .md file under the tasks directory."""
+        stack = [str(self.tasks_dir)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            yield entry
+            except OSError:
+                continue
+
+    def _find_task_file(self, task_id: str, rescan: bool = True) -> Optional[Path]:
         """Find task file by ID."""
-        for task_file in self.tasks_dir.rglob("*.md"):
-            if task_file.stem == task_id:
-                return task_file
-        return None
+        return self._stat_task_file(task_id, rescan)[0]
+
+    def _stat_task_file(
+        self, task_id: str, rescan: bool = True
+    ) -> Tuple[Optional[Path], Optional[os.stat_result]]:
+        """Find task file by ID and stat it, or return (None, None).
+
+        With ``rescan=False`` a miss trusts the index plus the default path
+        instead of walking the tasks directory again.
+        """
+        if self._id_index is None:
+            self._id_index = self._build_id_index()
+
+        task_file = self._id_index.get(task_id)
+        if task_file is not None:
+            try:
+                return task_file, os.stat(task_file)
+            except FileNotFoundError:
+                # Removed behind our back; rescan once
+                self._id_index = self._build_id_index()
+                task_file = self._id_index.get(task_id)
+                if task_file is None:
+                    return None, None
+        else:
+            # Pick up files written at the default location since the index was built
+            task_file = self._default_task_file_path(task_id)
+
+        try:
+            st = os.stat(task_file)
+        except FileNotFoundError:
+            if not rescan:
+                return None, None
+            # Written elsewhere since the index was built; rescan once
+            self._id_index = self._build_id_index()
+            task_file = self._id_index.get(task_id)
+            if task_file is None:
+                return None, None
+            try:
+                st = os.stat(task_file)
+            except FileNotFoundError:
+                return None, None
+        self._id_index[task_id] = task_file
+        return task_file, st
+
+    def _load_task_file(
+        self, file_path: Path, st: Optional[os.stat_result] = None
+    ) -> Optional[TaskModel]:
+        """Load task data from file, reusing the last parse if it is unchanged."""
+        key = str(file_path)
+        if st is None:
+            try:
+                st = os.stat(key)
+            except OSError:
+                return self._parse_task_file(file_path)
+
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._parse_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            # Callers mutate the model they get back, so hand out a copy
+            return cached[1].model_copy(deep=True) if cached[1] else None
+
+        task_data = self._parse_task_file(file_path)
+        self._parse_cache[key] = (
+            signature,
+            task_data.model_copy(deep=True) if task_data else None,
+        )
+        return task_data
 
-    def _load_task_file(self, file_path: Path) -> Optional[TaskModel]:
-        """Load task data from file."""
+    def _parse_task_file(self, file_path: Path) -> Optional[TaskModel]:
+        """Parse task data from file."""
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                content = _read_frontmatter_head(f)
+
+            task_data = _validate_json_frontmatter(content)
+            if task_data is not None:
+                return task_data
 
             # Extract frontmatter
             frontmatter = self._extract_frontmatter(content)
             if not frontmatter:
                 return None
 
-            # Convert datetime strings back to datetime objects if needed
-            if "created_at" in frontmatter:
-                if isinstance(frontmatter["created_at"], str):
-                    frontmatter["created_at"] = datetime.fromisoformat(
-                        frontmatter["created_at"]
-                    )
-            if "updated_at" in frontmatter:
-                if isinstance(frontmatter["updated_at"], str):
-                    frontmatter["updated_at"] = datetime.fromisoformat(
-                        frontmatter["updated_at"]
-                    )
-            if "due_date" in frontmatter and frontmatter["due_date"]:
-                if isinstance(frontmatter["due_date"], str):
-                    frontmatter["due_date"] = datetime.fromisoformat(
-                        frontmatter["due_date"]
-                    )
-
             return TaskModel(**frontmatter)
 
         except Exception:
@@ -428,10 +679,12 @@ class TaskManager:
         frontmatter = task_data.dict()
 
         # Generate markdown content
-        # The yaml.dump function will handle escaping automatically, no need to pre-escape
+        # JSON is valid YAML, so the block stays readable by YAML frontmatter
+        # parsers while being much cheaper to write and read back
 
         content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)}---
+{json.dumps(frontmatter, indent=2, ensure_ascii=False, default=str)}
+---
 
 # {task_data.title}
 
@@ -453,19 +706,45 @@ class TaskManager:
 _Add any additional notes or context here._
 """
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        data = content.encode("utf-8")
+        if self._file_has_content(file_path, data):
+            return
+
+        # Write beside the target and rename so readers never see a partial file
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self._parse_cache.pop(str(file_path), None)
+        self._by_tag = self._by_status = None
+
+        if self._id_index is not None:
+            self._id_index.setdefault(file_path.stem, file_path)
+
+    @staticmethod
+    def _file_has_content(file_path: Path, data: bytes) -> bool:
+        """Check whether file_path already holds exactly data."""
+        try:
+            if os.stat(file_path).st_size != len(data):
+                return False
+            with open(file_path, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
 
     def _extract_frontmatter(self, content: str) -> Optional[Dict[str, Any]]:
         """Extract YAML frontmatter from markdown content."""
-        # Match frontmatter pattern
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
 
         if not match:
             return None
 
         try:
-            return yaml.safe_load(match.group(1))
+            return _load_frontmatter(match.group(1))
         except yaml.YAMLError:
             return None
@@ -109,7 +109,11 @@ class GitUtils:
         if not GIT_AVAILABLE:
             return False
 
-        check_path = Path(path) if path else self.path
+        if path is None:
+            # __init__ already probed self.path
+            return self._repo is not None
+
+        check_path = Path(path)
 
         try:
             Repo(check_path, search_parent_directories=True)
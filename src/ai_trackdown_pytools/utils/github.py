@@ -1,14 +1,23 @@
 """GitHub integration utilities using GitHub CLI (gh)."""
 
+import functools
+import hashlib
 import json
+import random
 import subprocess
-from typing import Dict, Any, List, Optional, Tuple
+import time
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from urllib.parse import urlencode
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Largest page the REST listings accept
+_REST_PAGE_SIZE = 100
+
 
 class GitHubError(Exception):
     """Exception raised for GitHub-related errors."""
@@ -16,16 +25,79 @@ class GitHubError(Exception):
     pass
 
 
+class GitHubRateLimitError(GitHubError):
+    """Exception raised when GitHub rejects a request for rate limiting."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _rate_limit_error(
+    stderr: str, headers: Optional[Dict[str, str]] = None
+) -> Optional[GitHubRateLimitError]:
+    """Build a rate-limit error from a failed gh call, or None if it is not one.
+
+    ``Retry-After`` (secondary limits) wins; otherwise an exhausted primary
+    limit waits until ``X-RateLimit-Reset``.
+    """
+    headers = headers or {}
+    text = stderr.lower()
+    exhausted = headers.get("x-ratelimit-remaining") == "0"
+    if not (exhausted or "rate limit" in text or "http 429" in text):
+        return None
+
+    retry_after = None
+    if headers.get("retry-after", "").isdigit():
+        retry_after = float(headers["retry-after"])
+    elif exhausted and headers.get("x-ratelimit-reset", "").isdigit():
+        retry_after = max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+    return GitHubRateLimitError(f"GitHub rate limit hit: {stderr}", retry_after)
+
+
+def retry_rate_limited(
+    max_attempts: int = 5, base_delay: float = 1.0, max_delay: float = 60.0
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Retry a gh call that fails with GitHubRateLimitError.
+
+    Waits for the server-provided delay when there is one, else backs off
+    exponentially with full jitter. A wait longer than ``max_delay`` is not
+    slept through; the error is raised so the command fails fast.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return func(*args, **kwargs)
+                except GitHubRateLimitError as e:
+                    if e.retry_after is not None:
+                        delay = e.retry_after
+                    else:
+                        delay = random.uniform(0, base_delay * 2 ** (attempt - 1))
+                    if attempt == max_attempts or delay > max_delay:
+                        raise
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
+
+
 class GitHubCLI:
     """GitHub CLI wrapper for issue and PR management."""
 
-    def __init__(self, repo: str):
+    def __init__(self, repo: str, cache_dir: Optional[Path] = None):
         """Initialize GitHub CLI wrapper.
 
         Args:
             repo: Repository in format "owner/repo"
+            cache_dir: Directory for conditional-request response caching;
+                caching is disabled when None
         """
         self.repo = repo
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
 
         # Verify gh is available
         if not self._check_gh_available():
@@ -53,6 +125,7 @@ class GitHubCLI:
         except subprocess.CalledProcessError:
             return False
 
+    @retry_rate_limited()
     def _run_gh_command(self, args: List[str]) -> str:
         """Run a gh command and return output."""
         try:
@@ -61,7 +134,69 @@ class GitHubCLI:
             )
             return result.stdout
         except subprocess.CalledProcessError as e:
-            raise GitHubError(f"GitHub CLI error: {e.stderr}")
+            raise _rate_limit_error(e.stderr or "") or GitHubError(
+                f"GitHub CLI error: {e.stderr}"
+            )
+
+    @retry_rate_limited()
+    def _run_gh_api_cached(self, endpoint: str) -> Any:
+        """GET a REST endpoint, revalidating a cached response with its ETag.
+
+        GitHub answers an unchanged resource with 304 Not Modified, which does
+        not count against the rate limit; the cached body is reused then.
+        """
+        cache_file = (
+            self.cache_dir / f"{hashlib.sha256(endpoint.encode()).hexdigest()}.json"
+        )
+        cached = None
+        if cache_file.exists():
+            try:
+                cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            except ValueError:
+                cached = None
+
+        args = ["gh", "api", "--include", endpoint]
+        if cached:
+            if cached.get("etag"):
+                args.extend(["-H", f"If-None-Match: {cached['etag']}"])
+            if cached.get("last_modified"):
+                args.extend(["-H", f"If-Modified-Since: {cached['last_modified']}"])
+
+        # gh exits non-zero on 304, so inspect the status line ourselves
+        result = subprocess.run(args, capture_output=True, text=True)
+        head, sep, body = result.stdout.partition("\r\n\r\n")
+        if not sep:
+            head, _, body = result.stdout.partition("\n\n")
+        status_line, *header_lines = head.splitlines() or [""]
+        status = status_line.split()[1] if len(status_line.split()) > 1 else ""
+
+        if status == "304" and cached:
+            return cached["body"]
+
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if result.returncode != 0:
+            raise _rate_limit_error(result.stderr, headers) or GitHubError(
+                f"GitHub CLI error: {result.stderr}"
+            )
+
+        data = json.loads(body)
+        if headers.get("etag") or headers.get("last-modified"):
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps(
+                    {
+                        "etag": headers.get("etag"),
+                        "last_modified": headers.get("last-modified"),
+                        "body": data,
+                    }
+                ),
+                encoding="utf-8",
+            )
+        return data
 
     def create_issue(
         self,
@@ -118,6 +253,28 @@ class GitHubCLI:
         Returns:
             List of issue dictionaries
         """
+        if self.cache_dir is not None:
+            # REST pages support conditional requests. They also contain pull
+            # requests, so keep paging until the limit is met with real issues.
+            params = {"state": state, "per_page": _REST_PAGE_SIZE}
+            if labels:
+                params["labels"] = ",".join(labels)
+            issues: List[Dict[str, Any]] = []
+            page = 1
+            while len(issues) < limit:
+                items = self._run_gh_api_cached(
+                    f"repos/{self.repo}/issues?{urlencode({**params, 'page': page})}"
+                )
+                issues.extend(
+                    self._issue_from_rest(item)
+                    for item in items
+                    if "pull_request" not in item
+                )
+                if len(items) < _REST_PAGE_SIZE:
+                    break
+                page += 1
+            return issues[:limit]
+
         args = [
             "issue",
             "list",
@@ -137,6 +294,24 @@ class GitHubCLI:
         output = self._run_gh_command(args)
         return json.loads(output)
 
+    @staticmethod
+    def _issue_from_rest(issue: Dict[str, Any]) -> Dict[str, Any]:
+        """Reshape a REST API issue into the fields ``gh issue list --json`` emits."""
+        return {
+            "number": issue["number"],
+            "title": issue["title"],
+            "body": issue.get("body") or "",
+            "state": issue["state"].upper(),
+            "labels": [{"name": label["name"]} for label in issue.get("labels", [])],
+            "assignees": [
+                {"login": assignee["login"]} for assignee in issue.get("assignees", [])
+            ],
+            "createdAt": issue["created_at"],
+            "updatedAt": issue["updated_at"],
+            "id": issue["node_id"],
+            "url": issue["html_url"],
+        }
+
     def get_issue(self, number: int) -> Dict[str, Any]:
         """Get a specific issue by number.
 
@@ -399,15 +574,16 @@ class GitHubCLI:
 
             progress.update(task, description=f"Processing {len(issues)} issues...")
 
+            # Match issues to local tasks with one scan instead of one per issue
+            tasks_by_github_id = {}
+            for task_obj in task_manager.list_tasks():
+                github_id = task_obj.metadata.get("github_id")
+                if github_id is not None:
+                    tasks_by_github_id.setdefault(github_id, task_obj)
+
             for issue in issues:
                 # Check if we already have this issue locally
-                existing_tasks = task_manager.list_tasks()
-                existing_task = None
-
-                for task_obj in existing_tasks:
-                    if task_obj.metadata.get("github_id") == issue["id"]:
-                        existing_task = task_obj
-                        break
+                existing_task = tasks_by_github_id.get(issue["id"])
 
                 if existing_task:
                     # Update existing task
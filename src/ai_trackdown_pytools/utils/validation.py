@@ -11,6 +11,12 @@ from jsonschema import ValidationError
 import yaml
 from pydantic import ValidationError as PydanticValidationError
 
+try:
+    from referencing import Registry, Resource
+    from referencing.jsonschema import DRAFT7
+except ImportError:  # jsonschema < 4.18 resolves $ref without a shared registry
+    Registry = None
+
 # from ai_trackdown_pytools.core.models import (
 #     TaskModel, EpicModel, IssueModel, PRModel, ProjectModel,
 #     TicketModel, get_model_for_type, get_id_pattern_for_type
@@ -68,6 +74,8 @@ class SchemaValidator:
         """Initialize schema validator."""
         self.schema_dir = Path(__file__).parent.parent / "schemas"
         self._schemas = {}
+        self._compiled = {}
+        self._registry = None
         self._model_validators = {}
         self._load_schemas()
         self._setup_model_validators()
@@ -81,6 +89,51 @@ class SchemaValidator:
                     self._schemas[schema_name] = json.load(f)
             except (json.JSONDecodeError, FileNotFoundError):
                 continue
+        self._registry = self._build_registry()
+
+    def _build_registry(self):
+        """Build one ``$ref`` registry shared by every compiled validator.
+
+        Each schema is registered under its ``$id`` (or ``<name>.json``) so
+        cross-schema references resolve once instead of per validation.
+        """
+        if Registry is None:
+            return None
+        return Registry().with_resources(
+            (
+                schema.get("$id", f"{name}.json"),
+                Resource.from_contents(schema, default_specification=DRAFT7),
+            )
+            for name, schema in self._schemas.items()
+            if isinstance(schema, dict)
+        )
+
+    def _json_validator(self, schema_name: str):
+        """Return a cached jsonschema validator for a loaded schema.
+
+        Schemas are checked and compiled once; the cached validator is rebuilt
+        if the schema object stored in ``_schemas`` is replaced.
+        """
+        schema = self._schemas[schema_name]
+        validator = self._compiled.get(schema_name)
+        if validator is None or validator.schema is not schema:
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            registry = getattr(self, "_registry", None)
+            if registry is not None:
+                validator = validator_class(schema, registry=registry)
+            else:
+                validator = validator_class(schema)
+            self._compiled[schema_name] = validator
+        return validator
+
+    def _validate_json(self, data: Dict[str, Any], schema_name: str) -> None:
+        """Validate data like ``jsonschema.validate`` using the cached validator."""
+        error = jsonschema.exceptions.best_match(
+            self._json_validator(schema_name).iter_errors(data)
+        )
+        if error is not None:
+            raise error
 
     def _setup_model_validators(self) -> None:
         """Setup Pydantic model validators."""
@@ -138,10 +191,8 @@ class SchemaValidator:
             result.add_error(f"Schema '{schema_name}' not found")
             return result
 
-        schema = self._schemas[schema_name]
-
         try:
-            jsonschema.validate(data, schema)
+            self._validate_json(data, schema_name)
         except ValidationError as e:
             result.add_error(f"JSON Schema validation failed: {e.message}")
 
@@ -489,12 +540,11 @@ class SchemaValidator:
                 "warnings": [],
             }
 
-        schema = self._schemas[schema_name]
         errors = []
         warnings = []
 
         try:
-            jsonschema.validate(data, schema)
+            self._validate_json(data, schema_name)
         except ValidationError as e:
             errors.append(str(e.message))
 
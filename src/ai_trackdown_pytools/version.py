@@ -1,6 +1,6 @@
 """Version management for AI Trackdown PyTools."""
 
-import re
+from functools import lru_cache
 from typing import NamedTuple, Optional
 
 # Import version from __init__.py to maintain single source of truth
@@ -19,25 +19,14 @@ class Version(NamedTuple):
     @classmethod
     def parse(cls, version_string: str) -> "Version":
         """Parse a semantic version string."""
-        # Regex pattern for semantic versioning
-        pattern = r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-
-        match = re.match(pattern, version_string)
-        if not match:
-            raise ValueError(f"Invalid semantic version: {version_string}")
-
-        groups = match.groupdict()
-        return cls(
-            major=int(groups["major"]),
-            minor=int(groups["minor"]),
-            patch=int(groups["patch"]),
-            pre_release=groups.get("prerelease"),
-            build_metadata=groups.get("buildmetadata"),
-        )
+        version = _parse_version(version_string)
+        return version if cls is Version else cls(*version)
 
     def __str__(self) -> str:
         """Convert version to string."""
         version_str = f"{self.major}.{self.minor}.{self.patch}"
+        if not self.pre_release and not self.build_metadata:
+            return version_str
 
         if self.pre_release:
             version_str += f"-{self.pre_release}"
@@ -72,8 +61,63 @@ class Version(NamedTuple):
         return Version(self.major, self.minor, self.patch)
 
 
+@lru_cache(maxsize=256)
+def _parse_version(version_string: str) -> Version:
+    """Parse a semantic version string; successful results are memoized.
+
+    Version is an immutable tuple, so every caller can share one instance.
+    Invalid strings raise and are simply parsed again next time.
+    """
+    # A single left-to-right pass: core, then "-pre-release", then
+    # "+build". Unlike the regex it replaces, nothing here can backtrack.
+    rest, plus, build_metadata = version_string.partition("+")
+    core, dash, pre_release = rest.partition("-")
+
+    fields = core.split(".")
+    if len(fields) != 3 or not all(map(_is_numeric, fields)):
+        raise ValueError(f"Invalid semantic version: {version_string}")
+
+    if dash and not _valid_identifiers(pre_release, numeric_check=True):
+        raise ValueError(f"Invalid semantic version: {version_string}")
+
+    if plus and not _valid_identifiers(build_metadata, numeric_check=False):
+        raise ValueError(f"Invalid semantic version: {version_string}")
+
+    major, minor, patch = fields
+    return Version(
+        major=int(major),
+        minor=int(minor),
+        patch=int(patch),
+        pre_release=pre_release if dash else None,
+        build_metadata=build_metadata if plus else None,
+    )
+
+
+_IDENTIFIER_CHARS = frozenset(
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ-."
+)
+
+
+def _is_numeric(field: str) -> bool:
+    """Check for an ASCII digit run without a leading zero."""
+    return field.isascii() and field.isdigit() and (len(field) == 1 or field[0] != "0")
+
+
+def _valid_identifiers(identifiers: str, numeric_check: bool) -> bool:
+    """Check dot-separated identifiers; pre-release ones also reject leading zeros."""
+    if not _IDENTIFIER_CHARS.issuperset(identifiers):
+        return False
+    for identifier in identifiers.split("."):
+        if not identifier:
+            return False
+        if numeric_check and identifier.isdigit() and not _is_numeric(identifier):
+            return False
+    return True
+
+
 # Current version as Version object
 CURRENT_VERSION = Version.parse(__version__)
+_CURRENT_RELEASE = CURRENT_VERSION[:3]
 
 
 def get_version() -> str:
@@ -96,8 +140,9 @@ def is_stable_version() -> bool:
     return CURRENT_VERSION.is_stable()
 
 
+@lru_cache(maxsize=None)
 def format_version_info() -> str:
-    """Format version information for display."""
+    """Format version information for display (built once; it never changes)."""
     version_info = f"AI Trackdown PyTools v{get_version()}"
 
     if is_development_version():
@@ -108,29 +153,45 @@ def format_version_info() -> str:
     return version_info
 
 
+def _looks_like_version(version_string: str) -> bool:
+    """Cheaply reject strings that cannot be a semantic version."""
+    return (
+        bool(version_string)
+        and version_string[0].isdigit()
+        and version_string.count(".") >= 2
+    )
+
+
 def check_version_compatibility(required_version: str) -> bool:
     """Check if current version is compatible with required version."""
+    if not _looks_like_version(required_version):
+        return False
+
     try:
         required = Version.parse(required_version)
-        current = CURRENT_VERSION
+    except ValueError:
+        return False
 
-        # For 0.x versions, only same minor version is compatible (patch can be higher)
-        if current.major == 0:
-            return (
-                current.major == required.major
-                and current.minor == required.minor
-                and current.patch >= required.patch
-            )
+    return _check_compat(required.major, required.minor, required.patch)
 
-        # For 1.x+ versions, follow semantic versioning compatibility
-        return current.major == required.major and current.minor >= required.minor
 
-    except ValueError:
-        return False
+def _check_compat(req_major: int, req_minor: int, req_patch: int) -> bool:
+    """Check compatibility with a required (major, minor, patch) release."""
+    major, minor, patch = _CURRENT_RELEASE
+
+    # For 0.x versions, only same minor version is compatible (patch can be higher)
+    if major == 0:
+        return major == req_major and minor == req_minor and patch >= req_patch
+
+    # For 1.x+ versions, follow semantic versioning compatibility
+    return major == req_major and minor >= req_minor
 
 
 def validate_version_string(version_string: str) -> bool:
     """Validate that a version string follows semantic versioning."""
+    if not _looks_like_version(version_string):
+        return False
+
     try:
         Version.parse(version_string)
         return True
@@ -140,19 +201,19 @@ def validate_version_string(version_string: str) -> bool:
 
 # Version history tracking
 # This is maintained manually for version history reference
-VERSION_HISTORY = [
+VERSION_HISTORY: tuple[str, ...] = (
     "0.9.0",  # Initial semantic versioning implementation
     "1.0.0",  # First stable release - Production ready
     "1.1.0",  # Bug fixes and improvements
     "1.1.1",  # Additional bug fixes
     "1.1.2",  # Bug fixes and improvements
     "1.2.0",  # Major Enhancements and Archive Management
-]
+)
 
 
-def get_version_history() -> list[str]:
+def get_version_history() -> tuple[str, ...]:
     """Get the version history."""
-    return VERSION_HISTORY.copy()
+    return VERSION_HISTORY
 
 
 def get_latest_version() -> str:
@@ -181,14 +242,25 @@ FEATURES = {
     "improved_performance": "1.2.0",
 }
 
+# FEATURES parsed once at import, as (major, minor, patch) tuples. Comparing
+# only the release part lets a pre-release of X.Y.Z have X.Y.Z's features
+# instead of raising when a pre-release tag is compared with None.
+_FEATURE_VERSIONS = {
+    feature: Version.parse(version)[:3] for feature, version in FEATURES.items()
+}
+
+# Fixed for the life of the process; list_available_features() hands out copies
+_AVAILABLE_FEATURES = {
+    feature: version
+    for feature, version in FEATURES.items()
+    if _CURRENT_RELEASE >= _FEATURE_VERSIONS[feature]
+}
+
 
 def has_feature(feature_name: str) -> bool:
     """Check if a feature is available in the current version."""
-    if feature_name not in FEATURES:
-        return False
-
-    feature_version = Version.parse(FEATURES[feature_name])
-    return CURRENT_VERSION >= feature_version
+    feature_version = _FEATURE_VERSIONS.get(feature_name)
+    return feature_version is not None and _CURRENT_RELEASE >= feature_version
 
 
 def get_feature_version(feature_name: str) -> Optional[str]:
@@ -198,8 +270,4 @@ def get_feature_version(feature_name: str) -> Optional[str]:
 
 def list_available_features() -> dict[str, str]:
     """List all available features and their introduction versions."""
-    available_features = {}
-    for feature, version in FEATURES.items():
-        if has_feature(feature):
-            available_features[feature] = version
-    return available_features
+    return dict(_AVAILABLE_FEATURES)
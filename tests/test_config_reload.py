@@ -1,5 +1,6 @@
 """Test configuration reload and cache management functionality."""
 
+import os
 import time
 from pathlib import Path
 
@@ -172,3 +173,50 @@ class TestConfigReload:
 
         # Should return True when _loaded_at is None but file exists
         assert config.is_stale()
+
+    def _write_config(self, tmp_path, value):
+        """Write a config file under tmp_path and return its path."""
+        config_dir = tmp_path / ".ai-trackdown"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        config_file = config_dir / "config.yaml"
+        with open(config_file, "w") as f:
+            yaml.dump({"version": "1.0.0", "project": {"value": value}}, f)
+        return config_file
+
+    def test_load_detects_edit_within_same_mtime(self, tmp_path):
+        """Test load re-reads a file changed without an mtime change."""
+        config_file = self._write_config(tmp_path, "initial")
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        mtime_ns = config_file.stat().st_mtime_ns
+
+        self._write_config(tmp_path, "modified-value")
+        os.utime(config_file, ns=(mtime_ns, mtime_ns))
+
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        assert config.get("project.value") == "modified-value"
+
+    def test_load_keeps_unsaved_values_while_file_unchanged(self, tmp_path):
+        """Test load keeps set() values until the file changes on disk."""
+        config_file = self._write_config(tmp_path, "initial")
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        config.set("project.value", "unsaved")
+
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        assert config.get("project.value") == "unsaved"
+
+        time.sleep(0.01)
+        self._write_config(tmp_path, "external")
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        assert config.get("project.value") == "external"
+
+    def test_invalidate_forces_reload_without_marking_stale(self, tmp_path):
+        """Test invalidate makes load re-read but leaves is_stale alone."""
+        config_file = self._write_config(tmp_path, "initial")
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        config.set("project.value", "unsaved")
+
+        Config.invalidate()
+        assert not config.is_stale()
+
+        config = Config.load(config_path=config_file, project_path=tmp_path)
+        assert config.get("project.value") == "initial"
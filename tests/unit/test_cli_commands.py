@@ -1020,3 +1020,38 @@ class TestCLIIntegration:
             # Check overall status
             result = self.runner.invoke(app, ["status"])
             assert result.exit_code == 0
+
+
+class TestCommandsPackage:
+    """Test the lazily populated commands package."""
+
+    def test_single_canonical_package_file(self):
+        """Test the commands package resolves to one stable __init__.py."""
+        import importlib
+
+        import ai_trackdown_pytools.commands as commands
+
+        reimported = importlib.import_module("ai_trackdown_pytools.commands")
+
+        assert reimported is commands
+        assert Path(commands.__file__).name == "__init__.py"
+        assert Path(commands.__file__).parent.name == "commands"
+
+    def test_submodule_imported_once(self):
+        """Test attribute access caches the submodule on the package."""
+        import sys
+
+        import ai_trackdown_pytools.commands as commands
+
+        module = commands.bug
+
+        assert module is sys.modules["ai_trackdown_pytools.commands.bug"]
+        assert vars(commands)["bug"] is module
+        assert commands.bug is module
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names raise AttributeError."""
+        import ai_trackdown_pytools.commands as commands
+
+        with pytest.raises(AttributeError):
+            commands.does_not_exist
@@ -1,5 +1,6 @@
 """Unit tests for task management functionality."""
 
+import json
 import pytest
 import tempfile
 from pathlib import Path
@@ -587,6 +588,162 @@ class TestTaskManager:
         assert not task.file_path.exists()  # Old file should be moved
 
 
+class TestTaskManagerStorage:
+    """Test the task store: parse cache, file format and counter saves."""
+
+    @pytest.fixture
+    def task_manager(self, tmp_path):
+        """TaskManager for a fresh project."""
+        Project.create(tmp_path)
+        return TaskManager(tmp_path)
+
+    def test_load_reuses_parse_until_saved(self, task_manager):
+        """Unchanged files are parsed once; a save invalidates the cached parse."""
+        task = task_manager.create_task(title="Original")
+
+        with patch.object(
+            task_manager, "_parse_task_file", wraps=task_manager._parse_task_file
+        ) as parse:
+            task_manager.load_task(task.id)
+            task_manager.load_task(task.id)
+            assert parse.call_count == 1
+
+            task_manager.update_task(task.id, title="Renamed")
+            assert task_manager.load_task(task.id).title == "Renamed"
+            assert parse.call_count == 2
+
+    def test_loaded_model_is_a_copy(self, task_manager):
+        """Mutating a loaded task does not leak into the cached parse."""
+        task = task_manager.create_task(title="Original", tags=["a"])
+
+        loaded = task_manager.load_task(task.id)
+        loaded.data.title = "Changed"
+        loaded.data.tags.append("b")
+
+        reloaded = task_manager.load_task(task.id)
+        assert reloaded.title == "Original"
+        assert reloaded.tags == ["a"]
+
+    def test_external_edit_invalidates_cached_parse(self, task_manager):
+        """A file changed behind the manager's back is parsed again."""
+        task = task_manager.create_task(title="Original")
+        task_manager.load_task(task.id)
+
+        content = task.file_path.read_text(encoding="utf-8")
+        task.file_path.write_text(
+            content.replace('"Original"', '"Edited elsewhere"'), encoding="utf-8"
+        )
+
+        assert task_manager.load_task(task.id).title == "Edited elsewhere"
+
+    def test_delete_drops_cached_parse(self, task_manager):
+        """A deleted task is no longer served from the parse cache."""
+        task = task_manager.create_task(title="Doomed")
+        task_manager.load_task(task.id)
+
+        assert task_manager.delete_task(task.id)
+        assert str(task.file_path) not in task_manager._parse_cache
+        with pytest.raises(TaskError):
+            task_manager.load_task(task.id)
+
+    def test_json_frontmatter_round_trip(self, task_manager):
+        """Tasks are written with JSON frontmatter and read back unchanged."""
+        task = task_manager.create_task(
+            title="Round trip",
+            description="Line one\nLine two: with colon",
+            tags=["x", "y"],
+            assignees=["alice"],
+            metadata={"nested": {"n": 1}},
+        )
+
+        assert task.file_path.read_text(encoding="utf-8").startswith("---\n{")
+        loaded = task_manager.load_task(task.id)
+        assert loaded.data == task.data
+
+    def test_legacy_yaml_frontmatter_loads(self, task_manager):
+        """Files written with YAML frontmatter by older versions still load."""
+        task_file = task_manager._get_task_file_path("TSK-0100")
+        task_file.write_text(
+            "---\n"
+            "id: TSK-0100\n"
+            "title: Legacy task\n"
+            "status: in_progress\n"
+            "tags:\n"
+            "- legacy\n"
+            "created_at: 2024-01-01T12:00:00\n"
+            "updated_at: 2024-01-02T12:00:00\n"
+            "---\n\n"
+            "# Legacy task\n",
+            encoding="utf-8",
+        )
+
+        task = task_manager.load_task("TSK-0100")
+        assert task.title == "Legacy task"
+        assert task.status == "in_progress"
+        assert task.tags == ["legacy"]
+        assert task.created_at == datetime(2024, 1, 1, 12, 0)
+
+        # Saving rewrites the file with JSON frontmatter
+        task_manager.update_task("TSK-0100", title="Migrated")
+        assert task_file.read_text(encoding="utf-8").startswith("---\n{")
+        assert task_manager.load_task("TSK-0100").title == "Migrated"
+
+    def test_compact_iso_timestamps_load(self, task_manager):
+        """Compact ISO 8601 timestamps accepted by fromisoformat still load."""
+        task_file = task_manager._get_task_file_path("TSK-0101")
+        frontmatter = {
+            "id": "TSK-0101",
+            "title": "Compact dates",
+            "created_at": "20240101T120000",
+            "updated_at": "20240102T083000",
+            "due_date": "20240301",
+        }
+        task_file.write_text(
+            f"---\n{json.dumps(frontmatter)}\n---\n\n# Compact dates\n",
+            encoding="utf-8",
+        )
+
+        task = task_manager.load_task("TSK-0101")
+        assert task.created_at == datetime(2024, 1, 1, 12, 0)
+        assert task.updated_at == datetime(2024, 1, 2, 8, 30)
+        assert task.due_date == datetime(2024, 3, 1)
+
+    def test_unchanged_save_does_not_rewrite(self, task_manager):
+        """Saving identical content leaves the file untouched."""
+        task = task_manager.create_task(title="Stable")
+        before = task.file_path.stat().st_mtime_ns
+
+        with patch("ai_trackdown_pytools.core.task.os.replace") as replace:
+            task_manager.save_task(task)
+            replace.assert_not_called()
+
+        assert task.file_path.stat().st_mtime_ns == before
+        assert not task.file_path.with_name(task.file_path.name + ".tmp").exists()
+
+    def test_deferred_counter_save(self, task_manager):
+        """Counters advance per create but are saved once on exit."""
+        start = task_manager.config.get("tasks.counter", 1)
+        with patch.object(task_manager.config, "save") as save:
+            with task_manager.deferred_counter_save():
+                ids = [task_manager.create_task(title=f"T{i}").id for i in range(3)]
+                with task_manager.deferred_counter_save():
+                    ids.append(task_manager.create_task(title="Nested").id)
+                save.assert_not_called()
+
+            save.assert_called_once()
+
+        assert ids == [f"TSK-{n:04d}" for n in range(start, start + 4)]
+        assert task_manager.config.get("tasks.counter") == start + 4
+
+    def test_counter_saved_per_create_without_deferral(self, task_manager):
+        """Outside deferred_counter_save every create saves the counter."""
+        with patch.object(task_manager.config, "save") as save:
+            task_manager.create_task(title="One")
+            task_manager.create_task(title="Two")
+
+        assert save.call_count == 2
+
+
 class TestTaskError:
     """Test TaskError exception."""
 
@@ -0,0 +1,204 @@
+"""Unit tests for GitHub CLI utilities."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from ai_trackdown_pytools.utils.github import (
+    GitHubCLI,
+    GitHubError,
+    GitHubRateLimitError,
+)
+
+
+def _response(status, headers=None, body=None, returncode=0, stderr=""):
+    """Build a ``gh api --include`` result as subprocess.run returns it."""
+    head = [f"HTTP/2.0 {status}"]
+    head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    stdout = "\r\n".join(head) + "\r\n\r\n" + (json.dumps(body) if body else "")
+    return subprocess.CompletedProcess([], returncode, stdout=stdout, stderr=stderr)
+
+
+def _rest_issue(number, pull_request=False):
+    """A minimal REST API issue (or pull request) payload."""
+    issue = {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": None,
+        "state": "open",
+        "labels": [],
+        "assignees": [],
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-02T00:00:00Z",
+        "node_id": f"I_{number}",
+        "html_url": f"https://github.com/acme/widgets/issues/{number}",
+    }
+    if pull_request:
+        issue["pull_request"] = {}
+    return issue
+
+
+@pytest.fixture
+def gh(tmp_path):
+    """GitHubCLI with response caching, skipping the gh availability checks."""
+    with patch.object(
+        GitHubCLI, "_check_gh_available", return_value=True
+    ), patch.object(GitHubCLI, "_check_gh_auth", return_value=True):
+        return GitHubCLI("acme/widgets", cache_dir=tmp_path / "cache")
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of cached REST responses."""
+
+    def test_etag_is_stored_and_sent(self, gh):
+        """A 200 with an ETag is cached and revalidated with If-None-Match."""
+        body = [_rest_issue(1)]
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.return_value = _response(200, {"ETag": '"abc"'}, body)
+            assert gh._run_gh_api_cached("repos/acme/widgets/issues") == body
+            assert 'If-None-Match: "abc"' not in mock_run.call_args[0][0]
+
+            gh._run_gh_api_cached("repos/acme/widgets/issues")
+            assert 'If-None-Match: "abc"' in mock_run.call_args[0][0]
+
+    def test_not_modified_reuses_cached_body(self, gh):
+        """A 304 returns the cached body even though gh exits non-zero."""
+        body = [_rest_issue(1)]
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _response(200, {"ETag": '"abc"'}, body),
+                _response(304, {"ETag": '"abc"'}, returncode=1),
+            ]
+            gh._run_gh_api_cached("repos/acme/widgets/issues")
+            assert gh._run_gh_api_cached("repos/acme/widgets/issues") == body
+
+    def test_response_without_validators_is_not_cached(self, gh):
+        """Responses with neither ETag nor Last-Modified are never revalidated."""
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.return_value = _response(200, body=[_rest_issue(1)])
+            gh._run_gh_api_cached("repos/acme/widgets/issues")
+            gh._run_gh_api_cached("repos/acme/widgets/issues")
+
+        args = mock_run.call_args[0][0]
+        assert not any(arg.startswith("If-") for arg in args)
+        assert not gh.cache_dir.exists()
+
+
+class TestListIssues:
+    """Test listing issues through the cached REST path."""
+
+    def test_pages_past_pull_requests_to_fill_limit(self, gh):
+        """Pull requests on a page do not count towards the limit."""
+        page1 = [_rest_issue(n, pull_request=n % 2 == 0) for n in range(1, 101)]
+        page2 = [_rest_issue(n) for n in range(101, 131)]
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _response(200, body=page1),
+                _response(200, body=page2),
+            ]
+            issues = gh.list_issues(limit=60)
+
+        assert len(issues) == 60
+        assert all(
+            issue["number"] % 2 == 1 or issue["number"] > 100 for issue in issues
+        )
+        assert "page=2" in " ".join(mock_run.call_args[0][0])
+
+    def test_short_page_ends_listing(self, gh):
+        """A page smaller than the page size is the last one."""
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.return_value = _response(
+                200, body=[_rest_issue(1), _rest_issue(2, pull_request=True)]
+            )
+            issues = gh.list_issues(limit=100)
+
+        assert [issue["number"] for issue in issues] == [1]
+        assert mock_run.call_count == 1
+
+    def test_reshapes_rest_issue(self, gh):
+        """REST payloads are reshaped into the ``gh issue list --json`` fields."""
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.return_value = _response(200, body=[_rest_issue(7)])
+            (issue,) = gh.list_issues(limit=10)
+
+        assert issue["state"] == "OPEN"
+        assert issue["body"] == ""
+        assert issue["id"] == "I_7"
+        assert issue["url"].endswith("/issues/7")
+
+
+class TestRateLimitRetry:
+    """Test retrying gh calls that GitHub rejects for rate limiting."""
+
+    @pytest.fixture
+    def sleep(self):
+        """Stub out the backoff sleep."""
+        with patch("ai_trackdown_pytools.utils.github.time.sleep") as sleep:
+            yield sleep
+
+    def test_retry_after_header_sets_delay(self, gh, sleep):
+        """A secondary rate limit waits for Retry-After, then retries."""
+        body = [_rest_issue(1)]
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _response(
+                    403,
+                    {"Retry-After": "7"},
+                    returncode=1,
+                    stderr="HTTP 403: You have exceeded a secondary rate limit",
+                ),
+                _response(200, body=body),
+            ]
+            assert gh._run_gh_api_cached("repos/acme/widgets/issues") == body
+
+        sleep.assert_called_once_with(7.0)
+        assert mock_run.call_count == 2
+
+    def test_exhausted_limit_sleeps_until_reset(self, gh, sleep):
+        """An exhausted primary limit waits until X-RateLimit-Reset."""
+        body = [_rest_issue(1)]
+        with patch(
+            "ai_trackdown_pytools.utils.github.time.time", return_value=1000.0
+        ), patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                _response(
+                    403,
+                    {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1030"},
+                    returncode=1,
+                    stderr="HTTP 403: API rate limit exceeded",
+                ),
+                _response(200, body=body),
+            ]
+            assert gh._run_gh_api_cached("repos/acme/widgets/issues") == body
+
+        sleep.assert_called_once_with(30.0)
+
+    def test_gives_up_after_max_attempts(self, gh, sleep):
+        """Persistent rate limiting raises after the last attempt."""
+        rate_limited = subprocess.CalledProcessError(
+            1, ["gh"], stderr="HTTP 429: rate limit exceeded"
+        )
+        with patch(
+            "ai_trackdown_pytools.utils.github.random.uniform", return_value=0.5
+        ), patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = rate_limited
+            with pytest.raises(GitHubRateLimitError):
+                gh.create_issue("Title", "Body")
+
+        assert mock_run.call_count == 5
+        assert sleep.call_count == 4
+
+    def test_other_errors_are_not_retried(self, gh, sleep):
+        """Failures that are not rate limits raise immediately."""
+        with patch("ai_trackdown_pytools.utils.github.subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(
+                1, ["gh"], stderr="HTTP 404: Not Found"
+            )
+            with pytest.raises(GitHubError) as exc_info:
+                gh.create_issue("Title", "Body")
+
+        assert not isinstance(exc_info.value, GitHubRateLimitError)
+        assert mock_run.call_count == 1
+        sleep.assert_not_called()